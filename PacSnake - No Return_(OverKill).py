@@ -3,16 +3,19 @@
 # The level is defined by a text map, and movement/AI stay aligned to tile centers.
 
 import random
+from collections import deque
 import arcade
-from arcade import shape_list
-from arcade.types import Color
-from array import array
+from arcade.clock import GLOBAL_FIXED_CLOCK
+from pyglet import shapes
+from pyglet.graphics import Batch, Group
 import math
 
 # ----------------------------
 # Core tuning constants
 # ----------------------------
 TILE = 28                     # Size of one grid tile in pixels
+GAME_TICK = 1 / 60            # Fixed gameplay step (seconds); speeds below are per tick
+MAX_TICKS_PER_UPDATE = 4      # Most gameplay ticks run per update; time beyond that is dropped
 MOVE_SPEED = 4                # Player movement speed (pixels per frame)
 GHOST_SPEED = 3               # Ghost movement speed (pixels per frame)
 WAVE_BANNER_SECONDS = 2.0     # How long the "WAVE X" banner shows after a clear
@@ -40,6 +43,7 @@ FLOOR_BASE = (6, 9, 18)
 FLOOR_ALT = (7, 10, 19)  # ultra-subtle checker tint
 WALL_BASE = (10, 18, 45)
 WALL_EDGE = (70, 140, 235, 90)  # inner edge, low alpha
+WALL_EDGE_POWER = (WALL_EDGE[0], WALL_EDGE[1], WALL_EDGE[2], min(255, WALL_EDGE[3] + 40))  # brighter in power mode
 WALL_INSET = 4
 WALL_EDGE_WIDTH = 1.5
 FLOOR_BASE_POWER = (4, 7, 14)
@@ -54,6 +58,16 @@ WALL_GLOW_SCALE_OUTER = 2.0
 WALL_GLOW_PULSE_PERIOD = 4.0
 WALL_GLOW_PULSE_DEPTH = 0.12
 WALL_GLOW_POWER_BOOST = 1.06
+# Pulse intensity over one period, sampled WALL_GLOW_PULSE_STEPS times, so the
+# 20 Hz glow tick is a table index instead of sin plus the depth math.
+WALL_GLOW_PULSE_STEPS = 4096
+WALL_GLOW_PULSE_LUT = tuple(
+    1.0 - WALL_GLOW_PULSE_DEPTH / 2 + WALL_GLOW_PULSE_DEPTH * (0.5 + 0.5 * math.sin(2 * math.pi * i / WALL_GLOW_PULSE_STEPS))
+    for i in range(WALL_GLOW_PULSE_STEPS)
+)
+WALL_GLOW_PULSE_SCALE = WALL_GLOW_PULSE_STEPS / WALL_GLOW_PULSE_PERIOD
+# Every RGBA the glow can take, indexed by alpha, so pulsing reuses tuples
+WALL_GLOW_PALETTE = tuple((WALL_GLOW[0], WALL_GLOW[1], WALL_GLOW[2], a) for a in range(256))
 
 # ----------------------------
 # Orb styling
@@ -77,16 +91,17 @@ ORB_BIG_SCALE_MAX = 1.1
 ORB_RING_PERIOD = 1.0
 ORB_RING_SPAN = 9
 ORB_RING_ALPHA = 60
+# Every ring RGBA, indexed by alpha, so the per-frame ring fade reuses tuples
+ORB_RING_PALETTE = tuple((ORB_BIG_GLOW[0], ORB_BIG_GLOW[1], ORB_BIG_GLOW[2], a) for a in range(ORB_RING_ALPHA + 1))
 COIN_PULSE_STEP = 0.05
 SHOW_FPS = True
 TRAIL_LIFETIME = 1.15
 TRAIL_GRACE = 0.15
 TRAIL_ALPHA = 170
 TRAIL_COLOR = (220, 190, 120)
+TRAIL_PALETTE = tuple((TRAIL_COLOR[0], TRAIL_COLOR[1], TRAIL_COLOR[2], a) for a in range(256))
 TRAIL_RADIUS = 0.22  # as a fraction of TILE
 TRAIL_WAVE_BONUS_PCT = 0.12
-TRAIL_TOP_ROW_FIX = 6
-TRAIL_TOP_HIT_BOOST = 1.25
 
 # ----------------------------
 # Level layout
@@ -131,17 +146,113 @@ SCREEN_W = COLS * TILE
 SCREEN_H = ROWS * TILE + 60   # Extra space for HUD text at the top
 TITLE = "PacSnake - No Return"
 
+# HUD/menu layout (fixed for the window size, so texts are positioned once)
+HUD_Y_OFFSET = -2.2  # negative = lower, positive = higher
+HUD_LABEL_Y = SCREEN_H - 20 + HUD_Y_OFFSET
+HUD_VALUE_Y = SCREEN_H - HUD_HEIGHT + 10 + HUD_Y_OFFSET
+HUD_SCORE_X = HUD_PADDING + 10
+HUD_SCORE_RIGHT = SCREEN_W * 0.45
+HUD_WAVE_RIGHT = SCREEN_W * 0.65
+HUD_LIVES_LEFT = HUD_WAVE_RIGHT + 12
+HUD_LIVES_ICON_X = HUD_LIVES_LEFT + 8
+MENU_ICON_R = 18
+MENU_TITLE_GAP = 14
+# Tunnel wrap: sprites past one edge by half a tile reappear at the other
+WRAP_LEFT_X = -TILE / 2
+WRAP_RIGHT_X = SCREEN_W + TILE / 2
+# Overlay/HUD panel rects never move, so they are built once instead of per frame
+SCREEN_RECT = arcade.XYWH(SCREEN_W / 2, SCREEN_H / 2, SCREEN_W, SCREEN_H)
+HUD_RECT = arcade.XYWH(SCREEN_W / 2, SCREEN_H - HUD_HEIGHT / 2, SCREEN_W, HUD_HEIGHT)
+HUD_INNER_RECT = arcade.XYWH(
+    SCREEN_W / 2, SCREEN_H - HUD_HEIGHT / 2,
+    SCREEN_W - HUD_PADDING * 2, HUD_HEIGHT - HUD_PADDING * 2,
+)
+
+# Tunnel rows are any rows where both ends are open (not '#').
+# The map never changes, so this is computed once instead of per AI query,
+# as a per-row flag so membership is a plain index instead of a hash.
+# Padded like WALKABLE: IS_TUNNEL_ROW[r + 1], with False for the rows just off the map.
+# Rows of a player that has roamed further off the map must be range-checked first.
+IS_TUNNEL_ROW = (False,) + tuple(
+    LEVEL_MAP[r][0] != "#" and LEVEL_MAP[r][-1] != "#" for r in range(ROWS)
+) + (False,)
+
+# Walkability grid padded with a one-cell wall border: WALKABLE[r + 1][c + 1]
+# is True for open cells, so out-of-bounds probes just hit the border.
+WALKABLE = tuple(
+    tuple(0 <= r < ROWS and 0 <= c < COLS and LEVEL_MAP[r][c] != "#" for c in range(-1, COLS + 1))
+    for r in range(-1, ROWS + 1)
+)
+
+# Same padding, but the border counts as open: OPEN_NEIGHBOR[r + 1][c + 1] is
+# True unless (c,r) is a wall, so wall tiles on the map edge keep their outer
+# edge highlight. Used for neighbor probes when building the wall layers.
+OPEN_NEIGHBOR = tuple(
+    tuple(not (0 <= r < ROWS and 0 <= c < COLS) or WALKABLE[r + 1][c + 1] for c in range(-1, COLS + 1))
+    for r in range(-1, ROWS + 1)
+)
+
+# Pixel centers of every column/row, padded by one cell on each side like
+# WALKABLE (GRID_X[c + 1], GRID_Y[r + 1]) so a sprite half way through a
+# tunnel still maps to a center. Ghost snaps index these directly; anything
+# the player can reach goes through grid_to_world, which also covers cells
+# further off the map.
+GRID_X = tuple(c * TILE + TILE / 2 for c in range(-1, COLS + 1))
+GRID_Y = tuple((ROWS - 1 - r) * TILE + TILE / 2 for r in range(-1, ROWS + 1))
+# Unpadded views for build loops that only visit on-map cells.
+CELL_CX = GRID_X[1:-1]
+CELL_CY = GRID_Y[1:-1]
+
+# Cell offsets around the player that can hold a coin it overlaps: hit boxes are
+# smaller than a tile, so nothing further than one cell away can touch it.
+COIN_PROBE_OFFSETS = tuple((dc, dr) for dr in (-1, 0, 1) for dc in (-1, 0, 1))
+
+# ----------------------------
+# Direction codes
+# Directions are small ints so AI and movement index tuples instead of hashing
+# strings. DIRS maps each code to a (dx, dy) in grid space, applied to pixels later.
+# ----------------------------
+DIR_U, DIR_D, DIR_L, DIR_R, DIR_S = 0, 1, 2, 3, 4
+DIRS = (
+    (0, 1),    # U
+    (0, -1),   # D
+    (-1, 0),   # L
+    (1, 0),    # R
+    (0, 0),    # S (stopped)
+)
+OPP_DIR = (DIR_D, DIR_U, DIR_R, DIR_L, DIR_S)
+
+# ----------------------------
+# Draw order for the batched player/ghost shapes (lower order draws first)
+# ----------------------------
+GHOST_BODY_GROUP = Group(order=0)
+GHOST_EYE_GROUP = Group(order=1)
+GHOST_PUPIL_GROUP = Group(order=2)
+PLAYER_BODY_GROUP = Group(order=3)
+PLAYER_MOUTH_GROUP = Group(order=4)
+
+# ----------------------------
+# Draw order for the batched dot/pellet shapes
+# ----------------------------
+COIN_GLOW_GROUP = Group(order=0)
+COIN_CORE_GROUP = Group(order=1)
+COIN_RING_GROUP = Group(order=2)
+
+# ----------------------------
+# Draw order for the batched trail shapes
+# ----------------------------
+TRAIL_LINE_GROUP = Group(order=0)
+TRAIL_GLOW_GROUP = Group(order=1)
+TRAIL_CORE_GROUP = Group(order=2)
+
 # ----------------------------
-# Direction dictionary
-# Each direction maps to a (dx, dy) in grid space, but we later apply it to pixels.
+# Draw order for the batched static maze layers
 # ----------------------------
-DIRS = {
-    "U": (0, 1),
-    "D": (0, -1),
-    "L": (-1, 0),
-    "R": (1, 0),
-    "S": (0, 0),
-}
+FLOOR_GROUP = Group(order=0)
+CORRIDOR_GROUP = Group(order=1)
+WALL_GLOW_GROUP = Group(order=2)
+WALL_BASE_GROUP = Group(order=3)
+WALL_EDGE_GROUP = Group(order=4)
 
 # ----------------------------
 # Chase/Scatter timing schedule, classic Pac-Man style feel
@@ -178,10 +289,12 @@ STATE_GAME_OVER = "game_over"
 def grid_to_world(c, r):
     """Convert grid cell (col,row) into the pixel center used for drawing/movement.
     Keeps sprites locked to tile centers for clean intersections.
+    Nothing walls off the area past a tunnel mouth, so the player can roam any
+    distance off the map; cells beyond the padded tables are computed directly.
     """
-    x = c * TILE + TILE / 2
-    y = (ROWS - 1 - r) * TILE + TILE / 2
-    return x, y
+    if -1 <= c <= COLS and -1 <= r <= ROWS:
+        return GRID_X[c + 1], GRID_Y[r + 1]
+    return c * TILE + TILE / 2, (ROWS - 1 - r) * TILE + TILE / 2
 
 # Convert a world pixel position into its grid cell (col,row).
 def world_to_grid(x, y):
@@ -197,30 +310,33 @@ def world_to_grid(x, y):
 # True when a sprite is near a tile center (clean turns + AI decisions).
 def at_tile_center(x, y):
     """True when a position is close enough to a tile center.
-    This is the safe window to allow turning and AI direction changes.
+    This is the safe window to allow turning. Positions move in whole-pixel
+    steps, so integer modulo gives the same 0..1 px window as the float test.
+    Only speeds that divide TILE are guaranteed to land in it, so ghosts
+    (3 px/frame) decide on the step that crosses the center instead.
     """
-    return (abs((x - TILE / 2) % TILE) < 1.2) and (abs((y - TILE / 2) % TILE) < 1.2)
-
-# Rotate a 2D point around origin by angle (radians).
-def _rotate_point(px, py, angle_rad):
-    ca = math.cos(angle_rad)
-    sa = math.sin(angle_rad)
+    return (int(x) - TILE // 2) % TILE < 2 and (int(y) - TILE // 2) % TILE < 2
+
+# Direction code -> facing angle (radians), its pyglet rotation (clockwise
+# degrees) and its (cos, sin). Table lookups keep trig out of per-frame draws.
+_DIR_ANGLE = (math.pi / 2, -math.pi / 2, math.pi, 0.0, 0.0)
+_DIR_ROTATION = tuple(-math.degrees(a) for a in _DIR_ANGLE)
+_DIR_COSSIN = ((0.0, 1.0), (0.0, -1.0), (-1.0, 0.0), (1.0, 0.0), (1.0, 0.0))
+# Unit (cos, sin) of the two mouth edges (facing angle +/- 0.55 rad) per direction.
+_DIR_MOUTH_EDGES = tuple(
+    ((math.cos(a + 0.55), math.sin(a + 0.55)), (math.cos(a - 0.55), math.sin(a - 0.55)))
+    for a in _DIR_ANGLE
+)
+# Ghost pupil shift per direction, as a fraction of the eye radius (none when stopped).
+_DIR_PUPIL_SHIFT = ((0.0, 0.35), (0.0, -0.35), (-0.35, 0.0), (0.35, 0.0), (0.0, 0.0))
+
+
+# Rotate a 2D point around origin to face a direction code.
+def _rotate_point(px, py, d):
+    ca, sa = _DIR_COSSIN[d]
     return px * ca - py * sa, px * sa + py * ca
 
 
-# Map direction letter to angle in radians.
-def _dir_angle(d):
-    if d == "R":
-        return 0.0
-    if d == "U":
-        return math.pi / 2
-    if d == "L":
-        return math.pi
-    if d == "D":
-        return -math.pi / 2
-    return 0.0
-
-
 
 # ----------------------------
 # Small math helpers used by ghost AI
@@ -234,11 +350,11 @@ def clamp(v, lo, hi):
     return v
 
 
-# Brightness scale for an RGB/RGBA color.
+# Brightness scale for an RGB/RGBA color (clamp inlined: runs per orb per frame).
 def _scale_color(color, factor):
-    r = int(clamp(color[0] * factor, 0, 255))
-    g = int(clamp(color[1] * factor, 0, 255))
-    b = int(clamp(color[2] * factor, 0, 255))
+    r = 0 if (v := int(color[0] * factor)) < 0 else 255 if v > 255 else v
+    g = 0 if (v := int(color[1] * factor)) < 0 else 255 if v > 255 else v
+    b = 0 if (v := int(color[2] * factor)) < 0 else 255 if v > 255 else v
     if len(color) == 4:
         return (r, g, b, color[3])
     return (r, g, b)
@@ -251,29 +367,13 @@ def _with_alpha(color, alpha):
 # Opposite direction, used for no reverse rule and frightened reversal
 # Opposite direction helper (no-reverse rule).
 def opp_dir(d):
-    if d == "U":
-        return "D"
-    if d == "D":
-        return "U"
-    if d == "L":
-        return "R"
-    if d == "R":
-        return "L"
-    return "S"
+    return OPP_DIR[d]
 
 # Manhattan distance in grid cells, used for choosing best direction to target
 # Manhattan distance in grid cells (pathing heuristic).
 def manhattan(a, b):
     return abs(a[0] - b[0]) + abs(a[1] - b[1])
 
-# Checks if a grid cell is not a wall and inside bounds
-# True if a grid cell is inside the map and not a wall.
-def is_walkable_cell(c, r):
-    """True when a cell is inside bounds and not a wall."""
-    if r < 0 or r >= ROWS or c < 0 or c >= COLS:
-        return False
-    return LEVEL_MAP[r][c] != "#"
-
 # Wrap the column if the row is a tunnel row (open on both left and right edges)
 # This supports the classic "exit one side, appear on the other" behavior at grid level
 # Apply tunnel wrap for open left/right edges.
@@ -281,7 +381,7 @@ def wrap_cell_if_tunnel(c, r):
     """Wrap columns only on rows that have open left/right edges.
     This matches classic tunnel behavior and prevents accidental wrap.
     """
-    if r in {rr for rr in range(ROWS) if LEVEL_MAP[rr][0] != "#" and LEVEL_MAP[rr][COLS - 1] != "#"}:
+    if IS_TUNNEL_ROW[r + 1]:
         if c < 0:
             return COLS - 1, r
         if c >= COLS:
@@ -289,25 +389,132 @@ def wrap_cell_if_tunnel(c, r):
     return c, r
 
 
+# True if an axis-aligned box centered at (x,y) overlaps any wall tile.
+# Walls are exactly the '#' cells, so this matches a hit-box test against a
+# TILE-sized block per wall cell (touching edges do not count).
+def box_hits_wall(x, y, half_w, half_h):
+    c0 = int((x - half_w) // TILE)
+    c1 = -int(-(x + half_w) // TILE) - 1
+    b0 = int((y - half_h) // TILE)
+    b1 = -int(-(y + half_h) // TILE) - 1
+    c0 = max(c0, -1)
+    c1 = min(c1, COLS)
+    for b in range(b0, b1 + 1):
+        r = ROWS - 1 - b
+        if not 0 <= r < ROWS:
+            continue
+        row = OPEN_NEIGHBOR[r + 1]
+        for c in range(c0, c1 + 1):
+            if not row[c + 1]:
+                return True
+    return False
+
+
+# Bit d of PASS_MASK[r][c] is set when the cell next to (c,r) in direction d is
+# open by OPEN_NEIGHBOR (bit DIR_S: the cell itself). For a player-sized box
+# (half extent between TILE/2 - MOVE_SPEED and TILE/2) sitting exactly on an
+# open tile's center, that is the same answer box_hits_wall gives for one step.
+PASS_MASK = tuple(
+    tuple(
+        sum(1 << d for d in range(len(DIRS)) if OPEN_NEIGHBOR[r - DIRS[d][1] + 1][c + DIRS[d][0] + 1])
+        for c in range(COLS)
+    )
+    for r in range(ROWS)
+)
+
+
+# ----------------------------
+# Grid AI kernels
+# Plain functions over (col,row) ints so ghost pathing runs without method
+# dispatch or temporary option lists in its inner loops.
+# ----------------------------
+MOVE_DIRS = (DIR_U, DIR_D, DIR_L, DIR_R)
+
+# Neighbor cell one step in a direction (tunnel wrap applied).
+def step_cell(c, r, d):
+    dx, dy = DIRS[d]
+    return wrap_cell_if_tunnel(c + dx, r - dy)
+
+# Walk n cells ahead from (c,r), stopping at walls.
+def cell_ahead(c, r, d, n):
+    dx, dy = DIRS[d]
+    for _ in range(n):
+        nc, nr = wrap_cell_if_tunnel(c + dx, r - dy)
+        if not WALKABLE[nr + 1][nc + 1]:
+            break
+        c, r = nc, nr
+    return c, r
+
+# Valid movement directions out of (c,r).
+def valid_dirs(c, r):
+    options = []
+    for d in MOVE_DIRS:
+        nc, nr = step_cell(c, r, d)
+        if WALKABLE[nr + 1][nc + 1]:
+            options.append(d)
+    return options
+
+# Exits left after the no-reverse rule for a ghost heading d (reversing is
+# only allowed when it is the sole exit).
+def forward_dirs(options, d):
+    back = OPP_DIR[d]
+    if len(options) > 1 and back in options:
+        return tuple(o for o in options if o != back)
+    return tuple(options)
+
+# Each option from (c,r) paired with the cell it leads to: ((d, nc, nr), ...).
+def option_moves(c, r, options):
+    return tuple((d,) + step_cell(c, r, d) for d in options)
+
+# Move that lands closest to (tc,tr); ties are broken randomly.
+def choose_dir(tc, tr, moves):
+    rand = random.random
+    best = None
+    best_score = None
+    for d, nc, nr in moves:
+        score = abs(nc - tc) + abs(nr - tr)   # manhattan(), inlined for the AI loop
+        if best is None or score < best_score:
+            best = d
+            best_score = score
+        elif score == best_score and rand() < 0.35:
+            best = d
+    return best
+
+
+# ----------------------------
+# Trail sweep
+# ----------------------------
+# Cells the player swept from (lc,lr) to (c,r) this frame, excluding the start.
+# Straight moves fill every cell in between; a diagonal (only possible after a
+# snap) just yields the target. The common one-cell step returns immediately.
+def trail_sweep(lc, lr, c, r):
+    dc = c - lc
+    dr = r - lr
+    if dc == 0:
+        if dr == 1 or dr == -1:
+            return ((c, r),)
+        step = 1 if dr > 0 else -1
+        return tuple((lc, nr) for nr in range(lr + step, r + step, step))
+    if dr == 0:
+        if dc == 1 or dc == -1:
+            return ((c, r),)
+        step = 1 if dc > 0 else -1
+        return tuple((nc, lr) for nc in range(lc + step, c + step, step))
+    return ((c, r),)
+
+
 # ----------------------------
 # Sprite classes
 # Using simple shapes for visuals
 # ----------------------------
-# Wall tile sprite (solid block).
-class Wall(arcade.SpriteSolidColor):
-    """Wall tile: blocks movement and defines the maze layout."""
-    # A single solid block wall tile
-    def __init__(self, x, y):
-        super().__init__(TILE, TILE, WALL_BASE)
-        self.center_x = x
-        self.center_y = y
-
 # Dot / power pellet sprite, with pulse metadata.
 class Coin(arcade.SpriteSolidColor):
     """Dot/pellet state: value and pulse timing for visuals."""
+    __slots__ = ("value", "big", "pulse_offset", "index", "glow_shape", "core_shape", "ring_shape", "ring_base_r")
+
     # Dot or power pellet
     # value controls score and also acts as a simple way to detect power pellets (50)
-    def __init__(self, x, y, value=10, big=False):
+    def __init__(self, x, y, value=10, big=False, batch=None):
         size = 12 if big else 7
         super().__init__(size, size, arcade.color.WHITE)
         self.center_x = x
@@ -315,12 +522,77 @@ class Coin(arcade.SpriteSolidColor):
         self.value = value
         self.big = big
         self.pulse_offset = random.random() * 10.0
-        self.pulse_value = 0.0
+        self.index = 0   # Slot in PacmanGame's coin pulse lists
+        self.create_shapes(batch)
+
+    def create_shapes(self, batch):
+        """Create the persistent shapes in the shared coin batch; the pulse only restyles them.
+        Anything the pulse never changes (small glow radius, big core color) is set here once.
+        """
+        x, y = self.center_x, self.center_y
+        r = self.width / 2
+        big = self.big
+        glow_r = r if big else r * ORB_SMALL_GLOW_SCALE
+        core_color = ORB_BIG_CORE if big else ORB_SMALL_BASE
+        self.glow_shape = shapes.Circle(x, y, glow_r, batch=batch, group=COIN_GLOW_GROUP)
+        self.core_shape = shapes.Circle(x, y, r, color=core_color, batch=batch, group=COIN_CORE_GROUP)
+        self.ring_shape = None
+        self.ring_base_r = r * 1.2   # Ring radius at the start of each expansion
+        if big:
+            self.ring_shape = shapes.Arc(x, y, r, segments=32, thickness=2, batch=batch, group=COIN_RING_GROUP)
+        self.update_shapes(0.0)
+
+    def update_shapes(self, pulse):
+        """Restyle the glow/core shapes for a pulse value in [0, 1]."""
+        if self.big:
+            scale = ORB_BIG_SCALE_MIN + (ORB_BIG_SCALE_MAX - ORB_BIG_SCALE_MIN) * pulse
+            core_r = self.width / 2 * scale
+            glow_alpha = int(ORB_BIG_GLOW_ALPHA + ORB_BIG_GLOW_PULSE * pulse)
+            self.glow_shape.radius = core_r * ORB_BIG_GLOW_SCALE
+            self.glow_shape.color = _with_alpha(ORB_BIG_GLOW, glow_alpha)
+            self.core_shape.radius = core_r
+        else:
+            brightness = ORB_SMALL_MIN_BRIGHT + ORB_SMALL_PULSE_DEPTH * pulse
+            glow_alpha = int(ORB_SMALL_GLOW_ALPHA * (0.6 + 0.4 * pulse))
+            self.glow_shape.color = _with_alpha(ORB_SMALL_GLOW, glow_alpha)
+            self.core_shape.color = _scale_color(ORB_SMALL_BASE, brightness)
+
+    def update_ring(self, game_time):
+        """Advance the expanding power pellet ring (runs every frame)."""
+        ring_t = ((game_time + self.pulse_offset) % ORB_RING_PERIOD) / ORB_RING_PERIOD
+        ring_alpha = int(ORB_RING_ALPHA * (1.0 - ring_t))
+        ring = self.ring_shape
+        visible = ring_alpha > 2
+        if ring.visible != visible:
+            ring.visible = visible   # pyglet rebuilds vertices on every visible write
+        if visible:
+            # A hidden ring keeps its last geometry; it is restyled once it shows again
+            ring.radius = self.ring_base_r + ring_t * ORB_RING_SPAN
+            ring.color = ORB_RING_PALETTE[ring_alpha]
+
+    def delete_shapes(self):
+        """Free the batched shapes once the coin is eaten or rebuilt."""
+        self.glow_shape.delete()
+        self.core_shape.delete()
+        if self.ring_shape is not None:
+            self.ring_shape.delete()
 
 # Player sprite + score/lives + mouth animation state.
 class Player(arcade.Sprite):
     """Player state: score/lives + direction buffering + mouth animation."""
-    def __init__(self, x, y, lives=3):
+    __slots__ = (
+        "score",
+        "lives",
+        "dir",
+        "want_dir",
+        "mouth_open",
+        "mouth_timer",
+        "mouth_period",
+        "body_shape",
+        "mouth_shape",
+    )
+
+    def __init__(self, x, y, lives=3, batch=None):
         super().__init__()
         self.width = TILE - 6
         self.height = TILE - 6
@@ -328,13 +600,26 @@ class Player(arcade.Sprite):
         self.center_y = y
         self.score = 0
         self.lives = lives
-        self.dir = "S"        # Current movement direction
-        self.want_dir = "S"   # Buffered desired direction from input
+        self.dir = DIR_S        # Current movement direction
+        self.want_dir = DIR_S   # Buffered desired direction from input
 
         self.mouth_open = True
         self.mouth_timer = 0.0
         self.mouth_period = 0.12
 
+        # Persistent shapes in the shared actor batch; only moved/rotated per frame.
+        # The mouth wedge is built facing right around its first vertex (the center).
+        r = self.width / 2
+        self.body_shape = shapes.Circle(x, y, r, color=arcade.color.YELLOW, batch=batch, group=PLAYER_BODY_GROUP)
+        self.mouth_shape = shapes.Polygon(
+            (x, y),
+            (x + r * math.cos(0.55), y + r * math.sin(0.55)),
+            (x + r * math.cos(-0.55), y + r * math.sin(-0.55)),
+            color=arcade.color.BLACK,
+            batch=batch,
+            group=PLAYER_MOUTH_GROUP,
+        )
+
     def update_mouth(self, dt, is_moving):
         if not is_moving:
             self.mouth_open = True
@@ -345,40 +630,45 @@ class Player(arcade.Sprite):
             self.mouth_timer = 0.0
             self.mouth_open = not self.mouth_open
 
-    def draw(self):
-        r = self.width / 2
-        cx = self.center_x
-        cy = self.center_y
-
-        arcade.draw_circle_filled(cx, cy, r, arcade.color.YELLOW)
+    def update_shapes(self):
+        """Sync the batched body/mouth shapes with position, facing and mouth state."""
+        pos = (self.center_x, self.center_y)
+        self.body_shape.position = pos
+        self.mouth_shape.position = pos
 
         d = self.dir
-        if d == "S":
+        if d == DIR_S:
             d = self.want_dir
-        if d == "S":
-            d = "R"
+        if d == DIR_S:
+            d = DIR_R
 
-        if self.mouth_open:
-            ang = _dir_angle(d)
-
-            p1 = (r * 1.05, 0.0)
-            p2 = (r * 0.2, r * 0.65)
-            p3 = (r * 0.2, -r * 0.65)
-
-            x1, y1 = _rotate_point(p1[0], p1[1], ang)
-            x2, y2 = _rotate_point(p2[0], p2[1], ang)
-            x3, y3 = _rotate_point(p3[0], p3[1], ang)
-
-            arcade.draw_polygon_filled(
-                [(cx, cy), (cx + x2, cy + y2), (cx + x1, cy + y1), (cx + x3, cy + y3)],
-                arcade.color.BLACK
-            )
+        if self.mouth_shape.visible != self.mouth_open:
+            self.mouth_shape.visible = self.mouth_open
+        # pyglet rotates clockwise in degrees
+        self.mouth_shape.rotation = _DIR_ROTATION[d]
 
 
 # Ghost sprite with AI metadata, respawn, and visuals.
 class Enemy(arcade.Sprite):
     """Ghost state: AI type, scatter target, and respawn timers."""
-    def __init__(self, x, y, ghost_type, color, scatter_target):
+    __slots__ = (
+        "start_x",
+        "start_y",
+        "ghost_type",
+        "base_color",
+        "scatter_target",
+        "dir",
+        "respawn_timer",
+        "is_dead",
+        "exit_timer",
+        "decision_cell",
+        "body_parts",
+        "eye_parts",
+        "pupil_parts",
+        "shape_color",
+    )
+
+    def __init__(self, x, y, ghost_type, color, scatter_target, batch=None):
         super().__init__()
         self.width = TILE - 6
         self.height = TILE - 6
@@ -390,55 +680,72 @@ class Enemy(arcade.Sprite):
         self.color = color
         self.base_color = color
         self.scatter_target = scatter_target
-        self.dir = random.choice(["U", "D", "L", "R"])
+        self.dir = random.choice(MOVE_DIRS)
         self.respawn_timer = 0.0
         self.is_dead = False
         self.exit_timer = 0.0
+        self.decision_cell = None   # Cell of the last AI decision (one per tile)
 
-    def draw(self):
+        # Persistent shapes in the shared actor batch, stored with their offset
+        # from the sprite center so a frame only moves them.
         w = self.width
         h = self.height
-        cx = self.center_x
-        cy = self.center_y
-        col = self.color
+        body_r = w * 0.5
+        rect_h = h * 0.55
+        bump_r = w * 0.18
+        bump_y = -h * 0.42
+        eye_r = w * 0.14
+        eye_y = h * 0.10
+        pupil_r = eye_r * 0.45
 
-        top_r = w * 0.5
-        top_cy = cy + h * 0.15
+        def circle(ox, oy, radius, col, group):
+            return shapes.Circle(x + ox, y + oy, radius, color=col, batch=batch, group=group), ox, oy
 
-        arcade.draw_circle_filled(cx, top_cy, top_r, col)
+        rect_ox = -w / 2
+        rect_oy = -h * 0.15 - rect_h / 2
+        body_rect = shapes.Rectangle(
+            x + rect_ox, y + rect_oy, w, rect_h, color=color, batch=batch, group=GHOST_BODY_GROUP
+        )
+        self.body_parts = [
+            circle(0.0, h * 0.15, body_r, color, GHOST_BODY_GROUP),
+            (body_rect, rect_ox, rect_oy),
+            circle(-w * 0.28, bump_y, bump_r, color, GHOST_BODY_GROUP),
+            circle(0.0, bump_y, bump_r, color, GHOST_BODY_GROUP),
+            circle(w * 0.28, bump_y, bump_r, color, GHOST_BODY_GROUP),
+        ]
+        self.eye_parts = [
+            circle(-w * 0.16, eye_y, eye_r, arcade.color.WHITE, GHOST_EYE_GROUP),
+            circle(w * 0.16, eye_y, eye_r, arcade.color.WHITE, GHOST_EYE_GROUP),
+        ]
+        self.pupil_parts = [
+            circle(-w * 0.16, eye_y, pupil_r, arcade.color.BLACK, GHOST_PUPIL_GROUP),
+            circle(w * 0.16, eye_y, pupil_r, arcade.color.BLACK, GHOST_PUPIL_GROUP),
+        ]
+        self.shape_color = color
 
-        rect_w = w
-        rect_h = h * 0.55
-        rect_cy = cy - h * 0.15
-        arcade.draw_rect_filled(arcade.XYWH(cx, rect_cy, rect_w, rect_h), col)
+    def update_shapes(self):
+        """Sync the batched body/eye shapes with position, color and facing."""
+        cx = self.center_x
+        cy = self.center_y
 
-        bump_r = w * 0.18
-        bump_y = cy - h * 0.42
-        arcade.draw_circle_filled(cx - w * 0.28, bump_y, bump_r, col)
-        arcade.draw_circle_filled(cx, bump_y, bump_r, col)
-        arcade.draw_circle_filled(cx + w * 0.28, bump_y, bump_r, col)
+        col = self.color
+        recolor = col != self.shape_color
+        if recolor:
+            self.shape_color = col
+        for shape, ox, oy in self.body_parts:
+            shape.position = (cx + ox, cy + oy)
+            if recolor:
+                shape.color = col
+        for shape, ox, oy in self.eye_parts:
+            shape.position = (cx + ox, cy + oy)
 
-        eye_r = w * 0.14
-        eye_y = cy + h * 0.10
-        eye_x1 = cx - w * 0.16
-        eye_x2 = cx + w * 0.16
-
-        arcade.draw_circle_filled(eye_x1, eye_y, eye_r, arcade.color.WHITE)
-        arcade.draw_circle_filled(eye_x2, eye_y, eye_r, arcade.color.WHITE)
-
-        pdx, pdy = 0.0, 0.0
-        if self.dir == "R":
-            pdx = eye_r * 0.35
-        elif self.dir == "L":
-            pdx = -eye_r * 0.35
-        elif self.dir == "U":
-            pdy = eye_r * 0.35
-        elif self.dir == "D":
-            pdy = -eye_r * 0.35
+        eye_r = self.width * 0.14
+        sx, sy = _DIR_PUPIL_SHIFT[self.dir]
+        pdx = eye_r * sx
+        pdy = eye_r * sy
 
-        pupil_r = eye_r * 0.45
-        arcade.draw_circle_filled(eye_x1 + pdx, eye_y + pdy, pupil_r, arcade.color.BLACK)
-        arcade.draw_circle_filled(eye_x2 + pdx, eye_y + pdy, pupil_r, arcade.color.BLACK)
+        for shape, ox, oy in self.pupil_parts:
+            shape.position = (cx + ox + pdx, cy + oy + pdy)
 
 
 
@@ -446,35 +753,55 @@ class Enemy(arcade.Sprite):
 class PacmanGame(arcade.Window):
     """Main game window: owns sprites, timers, and core game state."""
     def __init__(self):
-        super().__init__(SCREEN_W, SCREEN_H, TITLE)
+        # Gameplay runs in on_fixed_update at GAME_TICK no matter how often
+        # arcade updates or draws, so movement speed never depends on frame rate.
+        # arcade's cap is inclusive (it runs cap + 1 ticks), hence the - 1.
+        super().__init__(
+            SCREEN_W, SCREEN_H, TITLE,
+            fixed_rate=GAME_TICK, fixed_frame_cap=MAX_TICKS_PER_UPDATE - 1,
+        )
         arcade.set_background_color(FLOOR_BASE)
 
         # SpriteLists store and draw/update groups efficiently
-        self.walls = arcade.SpriteList(use_spatial_hash=True)
-        self.coins = arcade.SpriteList(use_spatial_hash=True)
+        self.coins = arcade.SpriteList()  # Drawn via coin_batch; eaten via coin_by_cell lookups
         self.ghosts = arcade.SpriteList()
-        self.player_list = arcade.SpriteList()
-        self.floor_shapes = shape_list.ShapeElementList()
-        self.wall_base_shapes = shape_list.ShapeElementList()
-        self.wall_edge_shapes = shape_list.ShapeElementList()
-        self.wall_glow_shapes = shape_list.ShapeElementList()
-        self.corridor_shapes = shape_list.ShapeElementList()
+        self.static_batch = Batch()     # Floor/corridor/wall layers, drawn in one pass
+        self.floor_shapes = []
+        self.wall_base_shapes = []
+        self.wall_edge_shapes = []
+        self.wall_glow_inner_shapes = []
+        self.wall_glow_outer_shapes = []
+        self.corridor_shapes = []
+        self.edge_power_state = None    # Power tint currently applied to wall edges
+        self.floor_power_state = None   # Power tint currently applied to floor/corridor
+        self.glow_alphas = (WALL_GLOW_ALPHA_INNER, WALL_GLOW_ALPHA_OUTER)  # Glow alphas currently applied
+        self.actor_batch = Batch()      # Player + ghost shapes, drawn in one pass
+        self.trail_batch = Batch()      # Trail links/glows/cores, drawn in one pass
+        self.coin_batch = Batch()       # Dot/pellet shapes, drawn in one pass
+        self.banner_batch = Batch()     # Wave banner backdrop, built once
+        self.power_coins = []           # Big pellets, whose rings animate every frame
+        self.coin_roster = []           # Every coin of the map, reused by each wave
+        self.coin_by_cell = {}          # (col,row) -> live coin, for constant-time eat checks
+        self.coins_remaining = 0        # Live coin count; the wave is clear at 0
 
         # Core entities
         self.player = None
         self.spawn_pos = (0, 0)
         self.ghost_spawn_positions = []
+        self.blinky = None
+        self.player_cell = (0, 0)       # Player grid cell, sampled once per frame for ghost AI
+        self.valid_dirs = []            # Per-cell exit directions, filled by _build_level
+        self.forward_dirs = []          # Per-cell, per-heading exits without reversing
+        self.forward_moves = []         # forward_dirs paired with their destination cells
 
         # Timers and game state
         self.power_mode_timer = 0.0     # > 0 means ghosts are frightened and edible
         self.state = STATE_MENU
         self.end_timer = 0.0
         self.wave = 1
+        self.trail_lifetime = TRAIL_LIFETIME   # Cached _trail_lifetime(); refreshed when wave changes
         self.banner_timer = WAVE_BANNER_SECONDS
 
-        # Tunnel rows are any rows where both ends are open (not '#')
-        self.tunnel_rows = {r for r in range(ROWS) if LEVEL_MAP[r][0] != "#" and LEVEL_MAP[r][COLS - 1] != "#"}  # Open edge rows
-
         # Mode system for chase/scatter cycling
         self.mode_index = 0
         self.ghost_mode = CHASE_SCATTER_SCHEDULE[0][0]
@@ -488,9 +815,17 @@ class PacmanGame(arcade.Window):
         self.glow_update_timer = 0.0
         self.glow_intensity = 1.0
         self.coin_pulse_timer = 0.0
-        # Trail uses two structures: segments for drawing, cells for collisions.
-        self.trail_segments = []
-        self.trail_cells = {}  # Map of visited cells -> timestamp (fast grid collision checks)
+        # Coin pulse state as parallel lists indexed by Coin.index
+        self.coin_phases = []
+        self.coin_omegas = []
+        # Trail uses two structures: segments for drawing, a stamp grid for collisions.
+        # Segments are parallel FIFO queues (oldest first), since they expire in order.
+        self.trail_t = deque()
+        self.trail_tail_cell = None     # Cell of the newest segment
+        self.trail_shapes = deque()     # (link or None, glow, core) per segment
+        self.trail_stamps = self._empty_trail_stamps()  # Last visit time per cell
+        self.trail_far_stamps = {}      # (col,row) -> last visit, for cells past the padded grid
+        self.trail_cutoff = 0.0  # Stamps older than this have expired
         self.last_trail_cell = None
         self.trail_skip_next = False
         # Ghosts wait for the player's first move, then delay briefly before moving.
@@ -505,6 +840,7 @@ class PacmanGame(arcade.Window):
         self._update_wall_edge_colors(False)
         self._update_floor_colors(False)
         self._update_wall_glow(1.0)
+        self._build_texts()
 
         self.ghost_house_pos = self.ghost_spawn_positions[0] if len(self.ghost_spawn_positions) > 0 else self.spawn_pos
     
@@ -524,12 +860,6 @@ class PacmanGame(arcade.Window):
         # Player grid cell
         return self._cell_of_sprite(self.player)
 
-    # Direction letter -> (dx,dy) unit vector.
-    def _dir_to_vec(self, d):
-        """Direction char -> (dx,dy) unit vector in grid space."""
-        # Convert direction char to (dx,dy)
-        return DIRS[d]
-
     # Walk n cells ahead, stopping at walls (used by Pinky/Inky).
     def _cell_ahead(self, cell, direction, n):
         """Walk n grid cells ahead, stopping at walls.
@@ -537,16 +867,7 @@ class PacmanGame(arcade.Window):
         """
         # Walk n cells forward in a direction, stopping if we hit a wall
         # Used for Pinky and Inky targeting behavior
-        dx, dy = self._dir_to_vec(direction)
-        c, r = cell
-        for _ in range(n):
-            nc = c + dx
-            nr = r - dy
-            nc, nr = wrap_cell_if_tunnel(nc, nr)
-            if not is_walkable_cell(nc, nr):
-                return c, r
-            c, r = nc, nr
-        return c, r
+        return cell_ahead(cell[0], cell[1], direction, n)
 
     # Valid movement directions from a cell (intersections).
     def _valid_dirs_from_cell(self, cell):
@@ -556,52 +877,40 @@ class PacmanGame(arcade.Window):
         # Returns all valid movement directions out of a grid cell
         # Used for intersection decisions
         c, r = cell
-        options = []
-        for d in ["U", "D", "L", "R"]:
-            dx, dy = self._dir_to_vec(d)
-            nc = c + dx
-            nr = r - dy
-            nc, nr = wrap_cell_if_tunnel(nc, nr)
-            if is_walkable_cell(nc, nr):
-                options.append(d)
-        return options
+        if 0 <= r < ROWS and 0 <= c < COLS:
+            return self.valid_dirs[r][c]
+        # Off-grid cells only happen mid-tunnel; compute those on demand
+        return tuple(valid_dirs(c, r))
 
     # Choose a direction toward a target cell (or random if frightened).
-    def _choose_dir_to_target(self, ghost, target_cell, frightened=False):
-        """Pick a direction toward a target tile, respecting no-reverse rule.
+    def _choose_dir_to_target(self, ghost, frightened=False):
+        """Pick a direction toward the ghost's target tile, respecting no-reverse rule.
         Frightened mode chooses randomly among valid options.
         """
         # Core direction chooser:
         # - At intersections, pick the direction that minimizes distance to target
-        # - Avoid reversing unless forced
+        # - Avoid reversing unless forced (no-reverse options are precomputed per cell)
         # - In frightened mode, move randomly but still valid
         cell = self._cell_of_sprite(ghost)
-        options = self._valid_dirs_from_cell(cell)
+        c, r = cell
+        on_grid = 0 <= r < ROWS and 0 <= c < COLS
+        if on_grid:
+            options = self.forward_dirs[r][c][ghost.dir]
+        else:
+            options = forward_dirs(self._valid_dirs_from_cell(cell), ghost.dir)
         if len(options) == 0:
-            return "S"
-
-        back = opp_dir(ghost.dir)
-        if len(options) > 1 and back in options:
-            options.remove(back)
+            return DIR_S
 
         if frightened:
-            return random.choice(options)
-
-        best = None
-        best_score = None
-        for d in options:
-            dx, dy = self._dir_to_vec(d)
-            nc = cell[0] + dx
-            nr = cell[1] - dy
-            nc, nr = wrap_cell_if_tunnel(nc, nr)
-            score = manhattan((nc, nr), target_cell)
-            if best is None or score < best_score:
-                best = d
-                best_score = score
-            elif score == best_score and random.random() < 0.35:
-                best = d
-
-        return best if best is not None else random.choice(options)
+            return options[int(random.random() * len(options))]
+        if len(options) == 1:
+            # Corridor: the target cannot change the answer, so skip computing it
+            return options[0]
+
+        moves = self.forward_moves[r][c][ghost.dir] if on_grid else option_moves(c, r, options)
+        target_cell = self._ghost_target_cell(ghost)
+        best = choose_dir(target_cell[0], target_cell[1], moves)
+        return best if best is not None else options[int(random.random() * len(options))]
 
     # Compute ghost chase target based on ghost personality.
     def _ghost_target_cell(self, ghost):
@@ -610,10 +919,10 @@ class PacmanGame(arcade.Window):
         """
         # Computes the chase target tile depending on ghost personality
         # Scatter mode overrides all and returns ghost.corner target
-        p_cell = self._player_cell()
-        p_dir = self.player.dir if self.player.dir != "S" else self.player.want_dir
-        if p_dir == "S":
-            p_dir = "L"
+        p_cell = self.player_cell
+        p_dir = self.player.dir if self.player.dir != DIR_S else self.player.want_dir
+        if p_dir == DIR_S:
+            p_dir = DIR_L
 
         if self.ghost_mode == "scatter":
             return ghost.scatter_target
@@ -628,11 +937,7 @@ class PacmanGame(arcade.Window):
 
         if ghost.ghost_type == "inky":
             # Cyan: vector targeting using Blinky and a point 2 tiles ahead
-            blinky = None
-            for g in self.ghosts:
-                if g.ghost_type == "blinky":
-                    blinky = g
-                    break
+            blinky = self.blinky
             two_ahead = self._cell_ahead(p_cell, p_dir, 2)
             if blinky is None:
                 return two_ahead
@@ -645,7 +950,7 @@ class PacmanGame(arcade.Window):
         if ghost.ghost_type == "clyde":
             # Orange: chases unless close, then scatters
             g_cell = self._cell_of_sprite(ghost)
-            if manhattan(g_cell, p_cell) <= 6:
+            if abs(g_cell[0] - p_cell[0]) + abs(g_cell[1] - p_cell[1]) <= 6:
                 return ghost.scatter_target
             return p_cell
 
@@ -665,33 +970,50 @@ class PacmanGame(arcade.Window):
         for g in self.ghosts:
             if not g.is_dead:
                 g.dir = opp_dir(g.dir)
+                g.decision_cell = None  # Heading back may re-enter the decided cell
 
 
     # ----------------------------
     # Level building and resets
     # ----------------------------
-    # Parse LEVEL_MAP and create walls, coins, player, and ghost spawns.
+    # Parse LEVEL_MAP and create coins, player, and ghost spawns.
     def _build_level(self):
-        """Parse LEVEL_MAP into walls, coins, player spawn, and ghost spawns."""
-        # Read LEVEL_MAP and spawn walls, coins, player, and ghost spawn points
+        """Parse LEVEL_MAP into coins, player spawn, and ghost spawns.
+        Walls need no sprites: movement tests WALKABLE and the maze is drawn
+        from the static batch.
+        """
+        # Read LEVEL_MAP and spawn coins, player, and ghost spawn points
         for r in range(ROWS):
             for c in range(COLS):
                 ch = LEVEL_MAP[r][c]
-                x, y = grid_to_world(c, r)
-                if ch == "#":
-                    self.walls.append(Wall(x, y))
-                elif ch == ".":
-                    self.coins.append(Coin(x, y, value=10, big=False))
+                x, y = CELL_CX[c], CELL_CY[r]
+                if ch == ".":
+                    self.coins.append(Coin(x, y, value=10, big=False, batch=self.coin_batch))
                 elif ch == "o":
-                    self.coins.append(Coin(x, y, value=50, big=True))
+                    self.coins.append(Coin(x, y, value=50, big=True, batch=self.coin_batch))
                 elif ch == "P":
-                    self.player = Player(x, y, lives=3)
+                    self.player = Player(x, y, lives=3, batch=self.actor_batch)
                     self.spawn_pos = (x, y)
                 elif ch == "G":
                     self.ghost_spawn_positions.append((x, y))
-
-        # Add player sprite to the list so it gets drawn
-        self.player_list.append(self.player)
+        self.coin_roster = list(self.coins)
+        self._index_coins()
+
+        # Walls never move, so exits from each cell are computed once here
+        self.valid_dirs = [[tuple(valid_dirs(c, r)) for c in range(COLS)] for r in range(ROWS)]
+        # ...and so are the no-reverse options per heading: forward_dirs[r][c][dir]
+        self.forward_dirs = [
+            [tuple(forward_dirs(options, d) for d in range(len(OPP_DIR))) for options in row]
+            for row in self.valid_dirs
+        ]
+        # ...along with the cell each of those options steps into, for choose_dir
+        self.forward_moves = [
+            [
+                tuple(option_moves(c, r, options) for options in per_dir)
+                for c, per_dir in enumerate(row)
+            ]
+            for r, row in enumerate(self.forward_dirs)
+        ]
 
         # Ghost definitions:
         # Each ghost gets a type (behavior), a color, and a scatter corner target
@@ -705,31 +1027,26 @@ class PacmanGame(arcade.Window):
         # Spawn ghosts using the map G positions and rotate through the 4 ghost types
         for i, (x, y) in enumerate(self.ghost_spawn_positions):
             gt, col, scat = ghost_defs[i % len(ghost_defs)]
-            self.ghosts.append(Enemy(x, y, gt, col, scat))
+            ghost = Enemy(x, y, gt, col, scat, batch=self.actor_batch)
+            self.ghosts.append(ghost)
+            if gt == "blinky" and self.blinky is None:
+                self.blinky = ghost    # Inky targets relative to Blinky
 
     # Prebuild static floor/wall/glow layers for fast rendering.
     def _build_static_layers(self):
         """Prebuild floor/wall/glow shapes for faster drawing each frame."""
-        self.floor_shapes = shape_list.ShapeElementList()
-        self.wall_base_shapes = shape_list.ShapeElementList()
-        self.wall_edge_shapes = shape_list.ShapeElementList()
-        self.wall_glow_shapes = shape_list.ShapeElementList()
-
-        for r in range(ROWS):
-            for c in range(COLS):
-                if (r + c) % 2 != 0:
-                    x, y = grid_to_world(c, r)
-                    self.floor_shapes.append(
-                        shape_list.create_rectangle_filled(x, y, TILE, TILE, FLOOR_ALT)
-                    )
-                if LEVEL_MAP[r][c] != "#":
-                    x, y = grid_to_world(c, r)
-                    self.corridor_shapes.append(
-                        shape_list.create_rectangle_filled(x, y, TILE, TILE, CORRIDOR_TINT)
-                    )
-
-        def is_wall_cell(c, r):
-            return 0 <= r < ROWS and 0 <= c < COLS and LEVEL_MAP[r][c] == "#"
+        self.static_batch = Batch()
+        self.floor_shapes = []
+        self.wall_base_shapes = []
+        self.wall_edge_shapes = []
+        self.wall_glow_inner_shapes = []
+        self.wall_glow_outer_shapes = []
+        self.corridor_shapes = []
+        # Fresh shapes carry no power tint yet, so the next recolor must run
+        self.edge_power_state = None
+        self.floor_power_state = None
+        self.glow_alphas = (WALL_GLOW_ALPHA_INNER, WALL_GLOW_ALPHA_OUTER)
+        rect = self._static_rect
 
         inner_w = TILE - WALL_INSET * 2
         inner_h = TILE - WALL_INSET * 2
@@ -738,97 +1055,98 @@ class PacmanGame(arcade.Window):
         glow_outer_h = TILE * WALL_GLOW_SCALE_OUTER
         glow_inner_w = TILE * WALL_GLOW_SCALE_INNER
         glow_inner_h = TILE * WALL_GLOW_SCALE_INNER
-        for wall in self.walls:
-            c, r = world_to_grid(wall.center_x, wall.center_y)
-            open_up = not is_wall_cell(c, r - 1)
-            open_down = not is_wall_cell(c, r + 1)
-            open_left = not is_wall_cell(c - 1, r)
-            open_right = not is_wall_cell(c + 1, r)
-            is_boundary = open_up or open_down or open_left or open_right
-
-            if is_boundary:
-                outer = shape_list.create_rectangle_filled(
-                    wall.center_x,
-                    wall.center_y,
-                    glow_outer_w,
-                    glow_outer_h,
-                    (WALL_GLOW[0], WALL_GLOW[1], WALL_GLOW[2], WALL_GLOW_ALPHA_OUTER),
-                )
-                outer._base_alpha = WALL_GLOW_ALPHA_OUTER
-                self.wall_glow_shapes.append(outer)
-
-                inner = shape_list.create_rectangle_filled(
-                    wall.center_x,
-                    wall.center_y,
-                    glow_inner_w,
-                    glow_inner_h,
-                    (WALL_GLOW[0], WALL_GLOW[1], WALL_GLOW[2], WALL_GLOW_ALPHA_INNER),
-                )
-                inner._base_alpha = WALL_GLOW_ALPHA_INNER
-                self.wall_glow_shapes.append(inner)
-
-            self.wall_base_shapes.append(
-                shape_list.create_rectangle_filled(wall.center_x, wall.center_y, TILE, TILE, WALL_BASE)
-            )
-            if inner_w > 0 and inner_h > 0 and is_boundary:
-                if open_up:
-                    self.wall_edge_shapes.append(
-                        shape_list.create_rectangle_filled(
-                            wall.center_x,
-                            wall.center_y + inner_h / 2 - edge_half,
-                            inner_w,
-                            WALL_EDGE_WIDTH,
-                            WALL_EDGE,
-                        )
+
+        # One pass over the grid builds floor, corridor and wall shapes together
+        for r in range(ROWS):
+            row_up, row, row_down = OPEN_NEIGHBOR[r], OPEN_NEIGHBOR[r + 1], OPEN_NEIGHBOR[r + 2]
+            for c in range(COLS):
+                x, y = CELL_CX[c], CELL_CY[r]
+                if (r + c) % 2 != 0:
+                    self.floor_shapes.append(rect(x, y, TILE, TILE, FLOOR_ALT, FLOOR_GROUP))
+                if row[c + 1]:
+                    self.corridor_shapes.append(rect(x, y, TILE, TILE, CORRIDOR_TINT, CORRIDOR_GROUP))
+                    continue
+
+                open_up = row_up[c + 1]
+                open_down = row_down[c + 1]
+                open_left = row[c]
+                open_right = row[c + 2]
+                is_boundary = open_up or open_down or open_left or open_right
+
+                if is_boundary:
+                    outer = rect(
+                        x, y, glow_outer_w, glow_outer_h, WALL_GLOW_PALETTE[WALL_GLOW_ALPHA_OUTER], WALL_GLOW_GROUP
                     )
-                if open_down:
-                    self.wall_edge_shapes.append(
-                        shape_list.create_rectangle_filled(
-                            wall.center_x,
-                            wall.center_y - inner_h / 2 + edge_half,
-                            inner_w,
-                            WALL_EDGE_WIDTH,
-                            WALL_EDGE,
-                        )
+                    self.wall_glow_outer_shapes.append(outer)
+
+                    inner = rect(
+                        x, y, glow_inner_w, glow_inner_h, WALL_GLOW_PALETTE[WALL_GLOW_ALPHA_INNER], WALL_GLOW_GROUP
                     )
-                if open_left:
-                    self.wall_edge_shapes.append(
-                        shape_list.create_rectangle_filled(
-                            wall.center_x - inner_w / 2 + edge_half,
-                            wall.center_y,
-                            WALL_EDGE_WIDTH,
-                            inner_h,
-                            WALL_EDGE,
+                    self.wall_glow_inner_shapes.append(inner)
+
+                self.wall_base_shapes.append(rect(x, y, TILE, TILE, WALL_BASE, WALL_BASE_GROUP))
+                if inner_w > 0 and inner_h > 0 and is_boundary:
+                    if open_up:
+                        self.wall_edge_shapes.append(
+                            rect(
+                                x,
+                                y + inner_h / 2 - edge_half,
+                                inner_w,
+                                WALL_EDGE_WIDTH,
+                                WALL_EDGE,
+                                WALL_EDGE_GROUP,
+                            )
                         )
-                    )
-                if open_right:
-                    self.wall_edge_shapes.append(
-                        shape_list.create_rectangle_filled(
-                            wall.center_x + inner_w / 2 - edge_half,
-                            wall.center_y,
-                            WALL_EDGE_WIDTH,
-                            inner_h,
-                            WALL_EDGE,
+                    if open_down:
+                        self.wall_edge_shapes.append(
+                            rect(
+                                x,
+                                y - inner_h / 2 + edge_half,
+                                inner_w,
+                                WALL_EDGE_WIDTH,
+                                WALL_EDGE,
+                                WALL_EDGE_GROUP,
+                            )
+                        )
+                    if open_left:
+                        self.wall_edge_shapes.append(
+                            rect(
+                                x - inner_w / 2 + edge_half,
+                                y,
+                                WALL_EDGE_WIDTH,
+                                inner_h,
+                                WALL_EDGE,
+                                WALL_EDGE_GROUP,
+                            )
+                        )
+                    if open_right:
+                        self.wall_edge_shapes.append(
+                            rect(
+                                x + inner_w / 2 - edge_half,
+                                y,
+                                WALL_EDGE_WIDTH,
+                                inner_h,
+                                WALL_EDGE,
+                                WALL_EDGE_GROUP,
+                            )
                         )
-                    )
 
-    # Update a ShapeElement color buffer (Arcade 3.3 compatible).
-    def _set_shape_color(self, shape, color):
-        """Update a ShapeElement's color buffer (Arcade 3.3 compatibility)."""
-        new_color = Color.from_iterable(color)
-        shape.colors = [new_color] * len(shape.points)
-        shape.data = array("f", [c for a in zip(shape.points, shape.colors) for b in a for c in b])
+    # Create a centered rectangle in the static maze batch.
+    def _static_rect(self, cx, cy, w, h, color, group):
+        """Add a filled rectangle centered on (cx, cy) to the static batch."""
+        return shapes.Rectangle(
+            cx - w / 2, cy - h / 2, w, h, color=color, batch=self.static_batch, group=group
+        )
 
     # Boost wall inner edge when power mode is active.
     def _update_wall_edge_colors(self, power_active):
         """Boost wall edge brightness during power mode for mood shift."""
-        edge_alpha = WALL_EDGE[3]
-        if power_active:
-            edge_alpha = min(255, edge_alpha + 40)
-        edge_color = (WALL_EDGE[0], WALL_EDGE[1], WALL_EDGE[2], edge_alpha)
+        if power_active == self.edge_power_state:
+            return
+        self.edge_power_state = power_active
+        edge_color = WALL_EDGE_POWER if power_active else WALL_EDGE
         for shape in self.wall_edge_shapes:
-            self._set_shape_color(shape, edge_color)
-        self.wall_edge_shapes.dirties.update(self.wall_edge_shapes.batches.values())
+            shape.color = edge_color
 
     # Adjust wall glow alpha for slow neon pulsing.
     def _update_wall_glow(self, intensity):
@@ -837,44 +1155,90 @@ class PacmanGame(arcade.Window):
         if abs(intensity - self.glow_intensity) < 0.03:
             return
         self.glow_intensity = intensity
-        for shape in self.wall_glow_shapes:
-            base_alpha = getattr(shape, "_base_alpha", WALL_GLOW_ALPHA_INNER)
-            new_alpha = int(clamp(base_alpha * intensity, 0, 255))
-            self._set_shape_color(shape, (WALL_GLOW[0], WALL_GLOW[1], WALL_GLOW[2], new_alpha))
-        self.wall_glow_shapes.dirties.update(self.wall_glow_shapes.batches.values())
-
-    # Cache orb pulse values at a fixed step for performance.
+        # Shapes only change when a quantized alpha does, so key the rewrite on those
+        alphas = (
+            min(255, int(WALL_GLOW_ALPHA_INNER * intensity)),
+            min(255, int(WALL_GLOW_ALPHA_OUTER * intensity)),
+        )
+        if alphas == self.glow_alphas:
+            return
+        prev_inner, prev_outer = self.glow_alphas
+        self.glow_alphas = alphas
+        # Each layer shares one color, so a layer is only touched when its alpha moved
+        if alphas[0] != prev_inner:
+            color = WALL_GLOW_PALETTE[alphas[0]]
+            for shape in self.wall_glow_inner_shapes:
+                shape.color = color
+        if alphas[1] != prev_outer:
+            color = WALL_GLOW_PALETTE[alphas[1]]
+            for shape in self.wall_glow_outer_shapes:
+                shape.color = color
+
+    # Advance orb pulses at a fixed step for performance.
     def _update_coin_pulses(self, dt):
-        """Cache orb pulse values at a fixed cadence (keeps FPS stable)."""
+        """Restyle orb pulse shapes at a fixed cadence (keeps FPS stable)."""
         self.coin_pulse_timer += dt
         if self.coin_pulse_timer < COIN_PULSE_STEP:
             return
         self.coin_pulse_timer = 0.0
+        t = self.game_time
+        sin = math.sin
+        phases = self.coin_phases
+        omegas = self.coin_omegas
+        # Only coins still on the board are evaluated; eaten slots are skipped
         for coin in self.coins:
+            i = coin.index
+            coin.update_shapes(0.5 + 0.5 * sin(t * omegas[i] + phases[i]))
+
+    # Rebuild the parallel pulse lists after the coin set changes.
+    def _index_coins(self):
+        """Assign each coin its slot and rebuild the pulse phase/frequency lists."""
+        self.coin_phases = []
+        self.coin_omegas = []
+        for i, coin in enumerate(self.coins):
+            coin.index = i
             period = ORB_BIG_PULSE_PERIOD if coin.big else ORB_SMALL_PULSE_PERIOD
-            coin.pulse_value = 0.5 + 0.5 * math.sin(
-                (self.game_time + coin.pulse_offset) * (2 * math.pi / period)
-            )
+            omega = 2 * math.pi / period
+            self.coin_phases.append(coin.pulse_offset * omega)   # sin(t*w + phase) == sin((t+offset)*w)
+            self.coin_omegas.append(omega)
+        self.power_coins = [coin for coin in self.coins if coin.big]
+        self.coin_by_cell = {world_to_grid(coin.center_x, coin.center_y): coin for coin in self.coins}
+        self.coins_remaining = len(self.coins)
 
     # Darken floor slightly during power mode (mood shift).
     def _update_floor_colors(self, power_active):
         """Swap floor tints during power mode for subtle mood change."""
+        if power_active == self.floor_power_state:
+            return
+        self.floor_power_state = power_active
         base_color = FLOOR_BASE_POWER if power_active else FLOOR_BASE
         alt_color = FLOOR_ALT_POWER if power_active else FLOOR_ALT
         corridor_color = CORRIDOR_TINT_POWER if power_active else CORRIDOR_TINT
         arcade.set_background_color(base_color)
         for shape in self.floor_shapes:
-            self._set_shape_color(shape, alt_color)
-        self.floor_shapes.dirties.update(self.floor_shapes.batches.values())
+            shape.color = alt_color
         for shape in self.corridor_shapes:
-            self._set_shape_color(shape, corridor_color)
-        self.corridor_shapes.dirties.update(self.corridor_shapes.batches.values())
+            shape.color = corridor_color
+
+    # Fresh trail stamp grid, padded by one cell on every side like WALKABLE
+    # (trail_stamps[r + 1][c + 1]) so tunnel-mouth cells stay in range.
+    def _empty_trail_stamps(self):
+        return [[float("-inf")] * (COLS + 2) for _ in range(ROWS + 2)]
 
     # Clear all trail segments (death/reset).
     def _clear_trail(self):
         """Clear all trail data (used on death/reset)."""
-        self.trail_segments = []
-        self.trail_cells = {}
+        self.trail_t.clear()
+        self.trail_tail_cell = None
+        for link, glow, core in self.trail_shapes:
+            if link is not None:
+                link.delete()
+            glow.delete()
+            core.delete()
+        self.trail_shapes.clear()
+        self.trail_stamps = self._empty_trail_stamps()
+        self.trail_far_stamps.clear()
+        self.trail_cutoff = 0.0
         self.last_trail_cell = None
         self.trail_skip_next = False
 
@@ -886,22 +1250,31 @@ class PacmanGame(arcade.Window):
         if self.player is None:
             return False
         r = ROWS - 1 - int(self.player.center_y // TILE)
-        if r not in self.tunnel_rows:
+        if not (0 <= r < ROWS and IS_TUNNEL_ROW[r + 1]):
             return False
         return self.player.center_x < 0 or self.player.center_x > SCREEN_W
 
-    # Trail lifetime scales by wave.
+    # Trail lifetime scales by wave (cached in self.trail_lifetime per wave).
     def _trail_lifetime(self):
         """Trail lifetime scales by wave for difficulty ramp."""
         return TRAIL_LIFETIME * (1.0 + (self.wave - 1) * TRAIL_WAVE_BONUS_PCT)
 
     # Remove expired trail segments.
     def _update_trail(self):
-        """Prune expired trail segments and grid cells."""
-        lifetime = self._trail_lifetime()
+        """Prune expired trail segments and advance the cell expiry cutoff."""
+        lifetime = self.trail_lifetime
         cutoff = self.game_time - lifetime
-        self.trail_segments = [seg for seg in self.trail_segments if seg["t"] >= cutoff]
-        self.trail_cells = {k: t for k, t in self.trail_cells.items() if t >= cutoff}
+        # Segments are appended in time order, so expired ones are always at the front
+        trail_t = self.trail_t
+        while trail_t and trail_t[0] < cutoff:
+            trail_t.popleft()
+            link, glow, core = self.trail_shapes.popleft()
+            if link is not None:
+                link.delete()
+            glow.delete()
+            core.delete()
+        # Stamps are never swept; anything older than the cutoff reads as empty.
+        self.trail_cutoff = cutoff
 
     # Add a new trail segment at the given grid cell.
     def _add_trail_segment_cell(self, c, r):
@@ -911,131 +1284,96 @@ class PacmanGame(arcade.Window):
         if self._in_tunnel_transit():
             return False
         cell = (c, r)
-        if cell in self.trail_cells:
-            if (self.game_time - self.trail_cells[cell]) >= TRAIL_GRACE:
-                return True
-        self.trail_cells[cell] = self.game_time
+        if -1 <= r <= ROWS and -1 <= c <= COLS:
+            stamps, key = self.trail_stamps[r + 1], c + 1
+        else:
+            # The player can roam any distance past a tunnel mouth; those rare
+            # cells are stamped in a dict instead of growing the grid.
+            stamps, key = self.trail_far_stamps, cell
+            stamps.setdefault(cell, float("-inf"))
+        stamp = stamps[key]
+        if stamp >= self.trail_cutoff and (self.game_time - stamp) >= TRAIL_GRACE:
+            return True
+        stamps[key] = self.game_time
         if self.last_trail_cell == cell:
             return False
         self.last_trail_cell = cell
-        cx, cy = grid_to_world(c, r)
-        self.trail_segments.append({"x": cx, "y": cy, "t": self.game_time, "c": c, "r": r})
+        cx, cy = grid_to_world(c, r)   # The player may be off the map past a tunnel mouth
+        # Adjacency to the previous segment never changes, so it is decided once here
+        tail = self.trail_tail_cell
+        adjacent = bool(self.trail_t) and abs(tail[0] - c) + abs(tail[1] - r) == 1
+        self.trail_shapes.append(self._make_trail_shapes(cx, cy, tail if adjacent else None))
+        self.trail_t.append(self.game_time)
+        self.trail_tail_cell = cell
         return False
 
-    # Add a new trail segment at the current grid cell.
-    def _add_trail_segment(self, x, y):
-        """Add a trail segment based on current pixel position."""
-        c, r = world_to_grid(x, y)
-        return self._add_trail_segment_cell(c, r)
-
-    # Check player collision against the trail (after grace window).
-    def _check_trail_collision(self):
-        """Geometry-based trail collision (kept for reference)."""
-        if self.power_mode_timer > 0:
-            return False
-        if self._in_tunnel_transit():
-            return False
-        if not self.trail_segments:
-            return False
-        px = self.player.center_x
-        py = self.player.center_y
-        pc, pr = world_to_grid(px, py)
-        pc, pr = wrap_cell_if_tunnel(pc, pr)
-
-        player_r = self.player.width / 2
-        trail_r = TILE * TRAIL_RADIUS
-        line_w = max(2, trail_r * 2)
-        hit_point = player_r + trail_r
-        hit_line = player_r + line_w / 2
-        if pr <= TRAIL_TOP_ROW_FIX:
-            hit_point *= TRAIL_TOP_HIT_BOOST
-            hit_line *= TRAIL_TOP_HIT_BOOST
-
-        # Circle test against segment centers
-        for seg in self.trail_segments:
-            age = self.game_time - seg["t"]
-            if age < TRAIL_GRACE:
-                continue
-            dx = px - seg["x"]
-            dy = py - seg["y"]
-            if dx * dx + dy * dy <= hit_point * hit_point:
-                return True
-
-        # Line test between adjacent segments (only if both are out of grace)
-        prev = None
-        for seg in self.trail_segments:
-            if prev is not None:
-                prev_age = self.game_time - prev["t"]
-                age = self.game_time - seg["t"]
-                prev_new = prev_age < TRAIL_GRACE
-                seg_new = age < TRAIL_GRACE
-                if not prev_new and not seg_new:
-                    adjacent = abs(prev["c"] - seg["c"]) + abs(prev["r"] - seg["r"]) == 1
-                    if adjacent:
-                        ax, ay = prev["x"], prev["y"]
-                        bx, by = seg["x"], seg["y"]
-                        abx = bx - ax
-                        aby = by - ay
-                        apx = px - ax
-                        apy = py - ay
-                        ab_len2 = abx * abx + aby * aby
-                        if ab_len2 > 0:
-                            t = (apx * abx + apy * aby) / ab_len2
-                            t = clamp(t, 0.0, 1.0)
-                            cx = ax + abx * t
-                            cy = ay + aby * t
-                            dx = px - cx
-                            dy = py - cy
-                            if dx * dx + dy * dy <= hit_line * hit_line:
-                                return True
-            prev = seg
-        return False
+    # Create the batched shapes for a new trail segment.
+    def _make_trail_shapes(self, cx, cy, link_cell):
+        """Build the link (to link_cell, a grid-adjacent previous segment, if any),
+        glow and core shapes.
+        Colors are set every frame by _draw_trail as the segment fades.
+        """
+        radius = TILE * TRAIL_RADIUS
+        batch = self.trail_batch
+        link = None
+        if link_cell is not None:
+            link = shapes.Line(
+                *grid_to_world(*link_cell), cx, cy, thickness=max(2, radius * 2),
+                batch=batch, group=TRAIL_LINE_GROUP,
+            )
+        glow = shapes.Circle(cx, cy, radius * 1.35, batch=batch, group=TRAIL_GLOW_GROUP)
+        core = shapes.Circle(cx, cy, radius, batch=batch, group=TRAIL_CORE_GROUP)
+        return link, glow, core
 
     # Draw trail as connected path with fading alpha.
     def _draw_trail(self):
-        """Draw trail visuals only; collision uses grid occupancy elsewhere."""
-        if not self.trail_segments:
+        """Fade the batched trail shapes and draw them; collision uses grid occupancy elsewhere."""
+        if not self.trail_t:
             return
-        radius = TILE * TRAIL_RADIUS
-        line_width = max(2, radius * 2)
-        lifetime = self._trail_lifetime()
-        prev = None
+        # alpha = TRAIL_ALPHA * (1 - age / lifetime) is linear in the stamp time,
+        # so each segment costs one multiply-add. Expired segments (normally
+        # already pruned by _update_trail) come out <= 0 and are hidden.
+        slope = TRAIL_ALPHA / self.trail_lifetime
+        offset = TRAIL_ALPHA - self.game_time * slope
         prev_alpha = None
-        for seg in self.trail_segments:
-            age = self.game_time - seg["t"]
-            if age >= lifetime:
-                continue
-            alpha = int(TRAIL_ALPHA * (1.0 - age / lifetime))
+        for st, (link, glow, core) in zip(self.trail_t, self.trail_shapes):
+            alpha = int(st * slope + offset)
             if alpha <= 0:
+                # Fully faded (only ever the oldest few): hide, and link nothing to it
+                if core.visible:
+                    if link is not None:
+                        link.visible = False
+                    glow.visible = False
+                    core.visible = False
+                prev_alpha = None
                 continue
-            color = (TRAIL_COLOR[0], TRAIL_COLOR[1], TRAIL_COLOR[2], alpha)
-            if prev is not None:
-                adjacent = abs(prev["c"] - seg["c"]) + abs(prev["r"] - seg["r"]) == 1
-                if adjacent:
-                    line_alpha = alpha if prev_alpha is None else min(alpha, prev_alpha)
-                    line_color = (TRAIL_COLOR[0], TRAIL_COLOR[1], TRAIL_COLOR[2], line_alpha)
-                    arcade.draw_line(prev["x"], prev["y"], seg["x"], seg["y"], line_color, line_width)
+            # pyglet rebuilds vertices on every visible write, so only write flips
+            if link is not None:
+                if link.visible != (prev_alpha is not None):
+                    link.visible = prev_alpha is not None
+                if prev_alpha is not None:
+                    link.color = TRAIL_PALETTE[min(alpha, prev_alpha)]
             glow_alpha = int(alpha * 0.25)
-            if glow_alpha > 0:
-                glow_color = (TRAIL_COLOR[0], TRAIL_COLOR[1], TRAIL_COLOR[2], glow_alpha)
-                arcade.draw_circle_filled(seg["x"], seg["y"], radius * 1.35, glow_color)
-            arcade.draw_circle_filled(seg["x"], seg["y"], radius, color)
-            prev = seg
+            if glow.visible != (glow_alpha > 0):
+                glow.visible = glow_alpha > 0
+            glow.color = TRAIL_PALETTE[glow_alpha]
+            if not core.visible:
+                core.visible = True
+            core.color = TRAIL_PALETTE[alpha]
             prev_alpha = alpha
+        self.trail_batch.draw()
 
     # Small Pac-Man icon for menus.
     def _draw_pac_icon(self, x, y, r, facing):
         arcade.draw_circle_filled(x, y, r, (255, 220, 40))
 
-        ang = _dir_angle(facing)
-
-        mouth = 0.55
+        (c1, s1), (c2, s2) = _DIR_MOUTH_EDGES[facing]
         reach = r * 1.28
 
-        x1 = x + reach * math.cos(ang + mouth)
-        y1 = y + reach * math.sin(ang + mouth)
-        x2 = x + reach * math.cos(ang - mouth)
-        y2 = y + reach * math.sin(ang - mouth)
+        x1 = x + reach * c1
+        y1 = y + reach * s1
+        x2 = x + reach * c2
+        y2 = y + reach * s2
 
         arcade.draw_polygon_filled([(x, y), (x1, y1), (x2, y2)], (0, 0, 0, 190))
         arcade.draw_circle_outline(x, y, r, (255, 245, 170, 120), 2)
@@ -1045,142 +1383,39 @@ class PacmanGame(arcade.Window):
     # Start menu screen (title + controls).
     def _draw_start_menu(self):
         self.clear()
-        self._draw_floor()
-        self.wall_glow_shapes.draw()
-        self.wall_base_shapes.draw()
-        self.wall_edge_shapes.draw()
-
-        overlay_rect = arcade.XYWH(SCREEN_W / 2, SCREEN_H / 2, SCREEN_W, SCREEN_H)
-        arcade.draw_rect_filled(overlay_rect, (0, 0, 0, 190))
-
-        title_y = SCREEN_H / 2 + 96
-        title_text = "PacSnake - No Return"
-        title_size = 36
-        gap = 14
-        icon_r = 18
-        title_obj = arcade.Text(
-            title_text,
-            0,
-            0,
-            arcade.color.WHITE,
-            title_size,
-            font_name=HUD_FONT,
-            anchor_x="left",
-        )
-        group_w = icon_r * 2 + gap + title_obj.content_width
-        group_x = SCREEN_W / 2 - group_w / 2
-        icon_y = title_y + title_obj.content_height * 0.29
-        self._draw_pac_icon(group_x + icon_r, icon_y, icon_r, "R")
-        arcade.draw_text(
-            title_text,
-            group_x + icon_r * 2 + gap,
-            title_y,
-            arcade.color.WHITE,
-            title_size,
-            font_name=HUD_FONT,
-            anchor_x="left",
-        )
-        arcade.draw_text(
-            "Your path is the danger",
-            SCREEN_W / 2,
-            SCREEN_H / 2 + 35,
-            HUD_SUBTEXT,
-            14,
-            font_name=HUD_FONT,
-            anchor_x="center",
-        )
-        arcade.draw_text(
-            "[ ENTER ]  START",
-            SCREEN_W / 2,
-            SCREEN_H / 2 - 5,
-            arcade.color.WHITE,
-            18,
-            font_name=HUD_FONT,
-            anchor_x="center",
-        )
-        arcade.draw_text(
-            "[ ESC ]  EXIT",
-            SCREEN_W / 2,
-            SCREEN_H / 2 - 35,
-            HUD_SUBTEXT,
-            14,
-            font_name=HUD_FONT,
-            anchor_x="center",
-        )
+        self._draw_maze()
+
+        arcade.draw_rect_filled(SCREEN_RECT, (0, 0, 0, 190))
+
+        self._draw_pac_icon(*self.menu_icon_pos, MENU_ICON_R, DIR_R)
+        for text in self.menu_texts:
+            text.draw()
 
     # Game over screen (score + restart/exit).
     def _draw_game_over(self):
         self.clear()
-        self._draw_floor()
-        self.wall_glow_shapes.draw()
-        self.wall_base_shapes.draw()
-        self.wall_edge_shapes.draw()
-
-        overlay_rect = arcade.XYWH(SCREEN_W / 2, SCREEN_H / 2, SCREEN_W, SCREEN_H)
-        arcade.draw_rect_filled(overlay_rect, (0, 0, 0, 190))
-
-        arcade.draw_text(
-            "GAME OVER",
-            SCREEN_W / 2,
-            SCREEN_H / 2 + 50,
-            arcade.color.RED,
-            34,
-            font_name=HUD_FONT,
-            anchor_x="center",
-        )
-        arcade.draw_text(
-            "Score: {}".format(self.player.score),
-            SCREEN_W / 2,
-            SCREEN_H / 2 + 15,
-            arcade.color.WHITE,
-            18,
-            font_name=HUD_FONT,
-            anchor_x="center",
-        )
-        arcade.draw_text(
-            "[ ENTER ]  RESTART",
-            SCREEN_W / 2,
-            SCREEN_H / 2 - 20,
-            arcade.color.WHITE,
-            16,
-            font_name=HUD_FONT,
-            anchor_x="center",
-        )
-        arcade.draw_text(
-            "[ ESC ]  EXIT",
-            SCREEN_W / 2,
-            SCREEN_H / 2 - 45,
-            HUD_SUBTEXT,
-            14,
-            font_name=HUD_FONT,
-            anchor_x="center",
-        )
+        self._draw_maze()
+
+        arcade.draw_rect_filled(SCREEN_RECT, (0, 0, 0, 190))
+
+        self.game_over_score_text.text = "Score: {}".format(self.player.score)
+        for text in self.game_over_texts:
+            text.draw()
 
 
     # Rebuild only dots/pellets for a new wave.
     def _rebuild_coins(self):
         # Used for infinite waves:
-        # Clears coin list and rebuilds from LEVEL_MAP without touching walls
-        self.coins = arcade.SpriteList(use_spatial_hash=True)
-        for r in range(ROWS):
-            for c in range(COLS):
-                ch = LEVEL_MAP[r][c]
-                if ch == "." or ch == "o":
-                    x, y = grid_to_world(c, r)
-                    if ch == ".":
-                        self.coins.append(Coin(x, y, value=10, big=False))
-                    else:
-                        self.coins.append(Coin(x, y, value=50, big=True))
-
-    # Random non-wall world position (ghost respawn helper).
-    def _get_random_empty_pos(self):
-        # Picks a random non wall cell and returns its world coordinates
-        # Used for ghost respawn after being eaten
-        while True:
-            c = random.randint(1, COLS - 2)
-            r = random.randint(1, ROWS - 2)
-            if LEVEL_MAP[r][c] != "#":
-                return grid_to_world(c, r)
+        # Refills the same coin list from the coin roster built with the level;
+        # coin positions never change, so no sprites or SpriteList are reallocated.
+        for coin in self.coins:
+            coin.delete_shapes()
+        self.coins.clear()
+        for coin in self.coin_roster:
+            coin.pulse_offset = random.random() * 10.0
+            coin.create_shapes(self.coin_batch)
+            self.coins.append(coin)
+        self._index_coins()
 
     # Enter a non-playing state and freeze player.
     def _start_end_screen(self, new_state):
@@ -1188,14 +1423,15 @@ class PacmanGame(arcade.Window):
         # Transition into game over state and stop player movement
         self.state = new_state
         self.end_timer = 0.0
-        self.player.dir = "S"
-        self.player.want_dir = "S"
+        self.player.dir = DIR_S
+        self.player.want_dir = DIR_S
         self._clear_trail()
 
     # Full game reset for a fresh run.
     def _reset_game(self):
         """Hard reset for a fresh run (score, wave, timers, positions)."""
         self.wave = 1
+        self.trail_lifetime = self._trail_lifetime()
         self.banner_timer = 0.0
         self.power_mode_timer = 0.0
         self.power_mode_active = False
@@ -1209,6 +1445,7 @@ class PacmanGame(arcade.Window):
 
         self.player.score = 0
         self.player.lives = 3
+        self.hud_dirty = True
         self.game_time = 0.0
 
         self._rebuild_coins()
@@ -1225,8 +1462,8 @@ class PacmanGame(arcade.Window):
     def _reset_positions(self):
         """Reset player/ghost positions after death or wave clear."""
         self.player.center_x, self.player.center_y = self.spawn_pos
-        self.player.dir = "S"
-        self.player.want_dir = "S"
+        self.player.dir = DIR_S
+        self.player.want_dir = DIR_S
 
         # Snap player to grid center
         self._snap_to_tile_center(self.player)
@@ -1238,9 +1475,10 @@ class PacmanGame(arcade.Window):
             g.center_x, g.center_y = g.start_x, g.start_y
             g.is_dead = False
             g.respawn_timer = 0.0
-            g.dir = random.choice(["U", "D", "L", "R"])
+            g.dir = random.choice(MOVE_DIRS)
             g.color = g.base_color
             g.exit_timer = 0.0
+            g.decision_cell = None
 
             # Snap each ghost to grid center (MUST be inside the loop)
             self._snap_to_tile_center(g)
@@ -1257,11 +1495,11 @@ class PacmanGame(arcade.Window):
         """Small turn-assist: nudge onto axis to accept buffered turns."""
         c, r = world_to_grid(spr.center_x, spr.center_y)
         cx, cy = grid_to_world(c, r)
-        if direction in ("U", "D"):
+        if direction in (DIR_U, DIR_D):
             if abs(spr.center_x - cx) <= TURN_SNAP_PX:
                 spr.center_x = cx
                 return True
-        elif direction in ("L", "R"):
+        elif direction in (DIR_L, DIR_R):
             if abs(spr.center_y - cy) <= TURN_SNAP_PX:
                 spr.center_y = cy
                 return True
@@ -1280,19 +1518,24 @@ class PacmanGame(arcade.Window):
         # Wrap when crossing left/right edges, but only if sprite is on a tunnel row.
         # We do NOT require perfect tile-centering, because small drift can accumulate across waves.
 
+        # Nearly every call is in bounds, so the x test runs before the row lookup
+        x, y = spr.position
+        if WRAP_LEFT_X <= x <= WRAP_RIGHT_X:
+            return
+
         # Determine row from Y only (X can be outside bounds during wrap)
-        r = ROWS - 1 - int(spr.center_y // TILE)
+        r = ROWS - 1 - int(y // TILE)
 
-        if r not in self.tunnel_rows:
+        if not (0 <= r < ROWS and IS_TUNNEL_ROW[r + 1]):
             return
 
-        if spr.center_x < -TILE / 2:
-            spr.center_x = SCREEN_W + TILE / 2
+        if x < WRAP_LEFT_X:
+            spr.center_x = WRAP_RIGHT_X
             if spr is self.player:
                 self.trail_skip_next = True
                 self.last_trail_cell = None
-        elif spr.center_x > SCREEN_W + TILE / 2:
-            spr.center_x = -TILE / 2
+        else:
+            spr.center_x = WRAP_LEFT_X
             if spr is self.player:
                 self.trail_skip_next = True
                 self.last_trail_cell = None
@@ -1300,35 +1543,37 @@ class PacmanGame(arcade.Window):
 
     # Move a sprite one step; cancel if colliding with walls.
     def _try_step_sprite(self, spr, direction, speed):
-        """Move one step; revert if it would hit a wall."""
-        # Attempt to move a sprite one step
-        # If it hits a wall, revert and return False
+        """Move one step unless it would hit a wall."""
+        # Test the destination against the wall grid; only move if it is clear
         dx, dy = DIRS[direction]
-        old_x, old_y = spr.center_x, spr.center_y
-        spr.center_x += dx * speed
-        spr.center_y += dy * speed
-        if arcade.check_for_collision_with_list(spr, self.walls):
-            spr.center_x, spr.center_y = old_x, old_y
+        x, y = spr.position
+        nx = x + dx * speed
+        ny = y + dy * speed
+        if box_hits_wall(nx, ny, spr.width / 2, spr.height / 2):
             return False
+        spr.position = (nx, ny)
         return True
 
     # Check if a sprite can move in a direction without collision.
     def _can_move_dir(self, spr, direction):
         """Predictive wall check. Used for smooth buffered turning."""
-        # Look ahead one step to see if movement would collide
+        # Look ahead one step to see if movement would collide. Only the player
+        # asks, and it is usually exactly on a tile center (it moves in steps
+        # that divide TILE), where the precomputed exit mask gives the answer.
+        x, y = spr.position
+        c = int(x // TILE)
+        r = ROWS - 1 - int(y // TILE)
+        if 0 <= c < COLS and 0 <= r < ROWS and x == CELL_CX[c] and y == CELL_CY[r]:
+            return (PASS_MASK[r][c] >> direction) & 1 == 1
         dx, dy = DIRS[direction]
-        old_x, old_y = spr.center_x, spr.center_y
-        spr.center_x += dx * MOVE_SPEED
-        spr.center_y += dy * MOVE_SPEED
-        blocked = arcade.check_for_collision_with_list(spr, self.walls)
-        spr.center_x, spr.center_y = old_x, old_y
-        return not blocked
+        return not box_hits_wall(x + dx * MOVE_SPEED, y + dy * MOVE_SPEED, spr.width / 2, spr.height / 2)
 
     # Lose a life and reset or trigger game over.
     def _lose_life(self):
         """Lose a life, then reset or go to game over."""
         # Life management and game over trigger
         self.player.lives -= 1
+        self.hud_dirty = True
         if self.player.lives <= 0:
             self._start_end_screen(STATE_GAME_OVER)
         else:
@@ -1336,122 +1581,18 @@ class PacmanGame(arcade.Window):
 
 
 
-    # Draw static floor + corridor tint layers.
-    def _draw_floor(self):
-        """Draw the cached floor + corridor tint layers."""
-        self.floor_shapes.draw()
-        self.corridor_shapes.draw()
-
-    # Draw a dot/pellet with pulse/glow styling.
-    def _draw_coin(self, coin):
-        """Draw a dot/pellet with its pulse/glow styling."""
-        base_r = coin.width / 2
-        pulse = coin.pulse_value
-        if coin.big:
-            scale = ORB_BIG_SCALE_MIN + (ORB_BIG_SCALE_MAX - ORB_BIG_SCALE_MIN) * pulse
-            core_r = base_r * scale
-            glow_alpha = int(ORB_BIG_GLOW_ALPHA + ORB_BIG_GLOW_PULSE * pulse)
-            glow_color = _with_alpha(ORB_BIG_GLOW, glow_alpha)
-            arcade.draw_circle_filled(coin.center_x, coin.center_y, core_r * ORB_BIG_GLOW_SCALE, glow_color)
-            arcade.draw_circle_filled(coin.center_x, coin.center_y, core_r, ORB_BIG_CORE)
-
-            ring_t = ((self.game_time + coin.pulse_offset) % ORB_RING_PERIOD) / ORB_RING_PERIOD
-            ring_r = base_r * 1.2 + ring_t * ORB_RING_SPAN
-            ring_alpha = int(ORB_RING_ALPHA * (1.0 - ring_t))
-            if ring_alpha > 2:
-                ring_color = _with_alpha(ORB_BIG_GLOW, ring_alpha)
-                arcade.draw_circle_outline(coin.center_x, coin.center_y, ring_r, ring_color, border_width=2)
-        else:
-            brightness = ORB_SMALL_MIN_BRIGHT + ORB_SMALL_PULSE_DEPTH * pulse
-            core_color = _scale_color(ORB_SMALL_BASE, brightness)
-            glow_alpha = int(ORB_SMALL_GLOW_ALPHA * (0.6 + 0.4 * pulse))
-            glow_color = _with_alpha(ORB_SMALL_GLOW, glow_alpha)
-            arcade.draw_circle_filled(coin.center_x, coin.center_y, base_r * ORB_SMALL_GLOW_SCALE, glow_color)
-            arcade.draw_circle_filled(coin.center_x, coin.center_y, base_r, core_color)
-
-    # Draw the player with animated mouth.
-    def _draw_pacman(self, p):
-        """Draw Pac-Man with a simple mouth animation."""
-        r = p.width / 2
-        cx = p.center_x
-        cy = p.center_y
-
-        d = p.dir
-        if d == "S":
-            d = p.want_dir
-        if d == "S":
-            d = "R"
-
-        ang = 0.0
-        if d == "R":
-            ang = 0.0
-        elif d == "U":
-            ang = math.pi / 2
-        elif d == "L":
-            ang = math.pi
-        elif d == "D":
-            ang = -math.pi / 2
-
-        arcade.draw_circle_filled(cx, cy, r, arcade.color.YELLOW)
-
-        if p.mouth_open:
-            x1 = cx + r * math.cos(ang + 0.55)
-            y1 = cy + r * math.sin(ang + 0.55)
-            x2 = cx + r * math.cos(ang - 0.55)
-            y2 = cy + r * math.sin(ang - 0.55)
-            arcade.draw_polygon_filled([(cx, cy), (x1, y1), (x2, y2)], arcade.color.BLACK)
-
-
-    # Draw a ghost with simple body + eyes.
-    def _draw_ghost(self, g):
-        """Draw a ghost body + eyes based on its current direction."""
-        w = g.width
-        h = g.height
-        cx = g.center_x
-        cy = g.center_y
-        col = g.color
-
-        top_r = w * 0.5
-        top_cy = cy + h * 0.15
-        arcade.draw_circle_filled(cx, top_cy, top_r, col)
-
-        rect_w = w
-        rect_h = h * 0.55
-        rect_cy = cy - h * 0.15
-        arcade.draw_rect_filled(arcade.XYWH(cx, rect_cy, rect_w, rect_h), col)
-
-
-        bump_r = w * 0.18
-        bump_y = cy - h * 0.42
-        arcade.draw_circle_filled(cx - w * 0.28, bump_y, bump_r, col)
-        arcade.draw_circle_filled(cx, bump_y, bump_r, col)
-        arcade.draw_circle_filled(cx + w * 0.28, bump_y, bump_r, col)
-
-        eye_r = w * 0.14
-        eye_y = cy + h * 0.10
-        eye_x1 = cx - w * 0.16
-        eye_x2 = cx + w * 0.16
-
-        arcade.draw_circle_filled(eye_x1, eye_y, eye_r, arcade.color.WHITE)
-        arcade.draw_circle_filled(eye_x2, eye_y, eye_r, arcade.color.WHITE)
-
-        pdx, pdy = 0.0, 0.0
-        if g.dir == "R":
-            pdx = eye_r * 0.35
-        elif g.dir == "L":
-            pdx = -eye_r * 0.35
-        elif g.dir == "U":
-            pdy = eye_r * 0.35
-        elif g.dir == "D":
-            pdy = -eye_r * 0.35
-
-        pupil_r = eye_r * 0.45
-        arcade.draw_circle_filled(eye_x1 + pdx, eye_y + pdy, pupil_r, arcade.color.BLACK)
-        arcade.draw_circle_filled(eye_x2 + pdx, eye_y + pdy, pupil_r, arcade.color.BLACK)
-
-
-
+    # Draw static floor, corridor tint and wall layers.
+    def _draw_maze(self):
+        """Draw the cached floor, corridor and wall layers in one batch."""
+        self.static_batch.draw()
 
+    # Draw all dots/pellets from their batched pulse shapes.
+    def _draw_coins(self):
+        """Advance the power pellet rings and draw every coin in one batch."""
+        t = self.game_time
+        for coin in self.power_coins:
+            coin.update_ring(t)
+        self.coin_batch.draw()
 
     # Small Pac-Man icon used in HUD lives.
     def _draw_life_icon(self, x, y, r):
@@ -1462,9 +1603,9 @@ class PacmanGame(arcade.Window):
         p2 = (r * 0.2, r * 0.65)
         p3 = (r * 0.2, -r * 0.65)
 
-        x1, y1 = _rotate_point(p1[0], p1[1], 0.0)
-        x2, y2 = _rotate_point(p2[0], p2[1], 0.0)
-        x3, y3 = _rotate_point(p3[0], p3[1], 0.0)
+        x1, y1 = _rotate_point(p1[0], p1[1], DIR_R)
+        x2, y2 = _rotate_point(p2[0], p2[1], DIR_R)
+        x3, y3 = _rotate_point(p3[0], p3[1], DIR_R)
 
         arcade.draw_polygon_filled(
             [(x, y), (x + x2, y + y2), (x + x1, y + y1), (x + x3, y + y3)],
@@ -1474,66 +1615,121 @@ class PacmanGame(arcade.Window):
     # HUD: score, wave, lives, optional FPS.
     def _draw_hud(self):
         """Top HUD: score, wave, lives, and optional FPS."""
-        HUD_Y_OFFSET = -2.2 # negative = lower, positive = higher
-        hud_center_y = SCREEN_H - HUD_HEIGHT / 2
-        hud_rect = arcade.XYWH(SCREEN_W / 2, hud_center_y, SCREEN_W, HUD_HEIGHT)
-        arcade.draw_rect_filled(hud_rect, HUD_BG)
-
-        inner_w = SCREEN_W - HUD_PADDING * 2
-        inner_h = HUD_HEIGHT - HUD_PADDING * 2
-        inner_rect = arcade.XYWH(SCREEN_W / 2, hud_center_y, inner_w, inner_h)
-        arcade.draw_rect_filled(inner_rect, HUD_PANEL)
-        arcade.draw_rect_outline(inner_rect, HUD_BORDER, border_width=2)
-
-        score_right = SCREEN_W * 0.45
-        wave_right = SCREEN_W * 0.65
+        arcade.draw_rect_filled(HUD_RECT, HUD_BG)
+        arcade.draw_rect_filled(HUD_INNER_RECT, HUD_PANEL)
+        arcade.draw_rect_outline(HUD_INNER_RECT, HUD_BORDER, border_width=2)
+
         line_bottom = SCREEN_H - HUD_HEIGHT + 6
         line_top = SCREEN_H - 6
-        arcade.draw_line(score_right, line_bottom, score_right, line_top, HUD_BORDER, 2)
-        arcade.draw_line(wave_right, line_bottom, wave_right, line_top, HUD_BORDER, 2)
+        arcade.draw_line(HUD_SCORE_RIGHT, line_bottom, HUD_SCORE_RIGHT, line_top, HUD_BORDER, 2)
+        arcade.draw_line(HUD_WAVE_RIGHT, line_bottom, HUD_WAVE_RIGHT, line_top, HUD_BORDER, 2)
 
-        label_y = SCREEN_H - 20 + HUD_Y_OFFSET
-        value_y = SCREEN_H - HUD_HEIGHT + 10 + HUD_Y_OFFSET
+        # Labels never change; values are re-laid out only after a change marks the HUD dirty
+        if self.hud_dirty:
+            self._update_hud_values()
+        for text in self.hud_texts:
+            text.draw()
 
-
-        score_x = HUD_PADDING + 10
-        arcade.draw_text("SCORE", score_x, label_y, HUD_LABEL, 12, font_name=HUD_FONT)
-        arcade.draw_text("{:06d}".format(self.player.score), score_x, value_y, HUD_VALUE, 20, font_name=HUD_FONT)
-
-        wave_center = (score_right + wave_right) / 2
-        arcade.draw_text("WAVE", wave_center, label_y, HUD_LABEL, 12, font_name=HUD_FONT, anchor_x="center")
-        arcade.draw_text(str(self.wave), wave_center, value_y, HUD_VALUE, 20, font_name=HUD_FONT, anchor_x="center")
-
-        lives_left = wave_right + 12
-        arcade.draw_text("LIVES", lives_left, label_y, HUD_LABEL, 12, font_name=HUD_FONT)
-
-        life_r = 6
-        life_y = value_y + 8
+        life_y = HUD_VALUE_Y + 8
         icons_to_draw = min(self.player.lives, 6)
-        icon_start_x = lives_left + 8
         for i in range(icons_to_draw):
-            self._draw_life_icon(icon_start_x + i * 16, life_y, life_r)
-
-        arcade.draw_text(
-            "x{}".format(self.player.lives),
-            icon_start_x + icons_to_draw * 16 + 6,
-            value_y + 2,
-            HUD_SUBTEXT,
-            12,
-            font_name=HUD_FONT
+            self._draw_life_icon(HUD_LIVES_ICON_X + i * 16, life_y, 6)
+
+    # Refresh the HUD value texts after score/wave/lives change.
+    def _update_hud_values(self):
+        """Re-layout score/wave/lives texts; FPS text is refreshed by its own 4 Hz tick."""
+        self.hud_dirty = False
+        lives = self.player.lives
+        self.hud_score_text.text = "{:06d}".format(self.player.score)
+        self.hud_wave_text.text = str(self.wave)
+        self.hud_lives_text.text = "x{}".format(lives)
+        self.hud_lives_text.x = HUD_LIVES_ICON_X + min(lives, 6) * 16 + 6
+
+    # Build every menu/HUD/banner text once; per-frame code only draws them.
+    def _build_texts(self):
+        """Create the arcade.Text objects for all screens.
+        Rebuilding text every frame re-lays out glyphs, so only changing values are updated.
+        """
+        center_x = SCREEN_W / 2
+        center_y = SCREEN_H / 2
+
+        # Start menu: center the icon + title as one group
+        title_y = center_y + 96
+        title = arcade.Text(
+            TITLE, 0, title_y, arcade.color.WHITE, 36, font_name=HUD_FONT, anchor_x="left",
+        )
+        group_w = MENU_ICON_R * 2 + MENU_TITLE_GAP + title.content_width
+        group_x = center_x - group_w / 2
+        title.x = group_x + MENU_ICON_R * 2 + MENU_TITLE_GAP
+        self.menu_icon_pos = (group_x + MENU_ICON_R, title_y + title.content_height * 0.29)
+        self.menu_texts = (
+            title,
+            arcade.Text(
+                "Your path is the danger", center_x, center_y + 35,
+                HUD_SUBTEXT, 14, font_name=HUD_FONT, anchor_x="center",
+            ),
+            arcade.Text(
+                "[ ENTER ]  START", center_x, center_y - 5,
+                arcade.color.WHITE, 18, font_name=HUD_FONT, anchor_x="center",
+            ),
+            arcade.Text(
+                "[ ESC ]  EXIT", center_x, center_y - 35,
+                HUD_SUBTEXT, 14, font_name=HUD_FONT, anchor_x="center",
+            ),
         )
 
+        # Game over screen
+        self.game_over_score_text = arcade.Text(
+            "", center_x, center_y + 15, arcade.color.WHITE, 18, font_name=HUD_FONT, anchor_x="center",
+        )
+        self.game_over_texts = (
+            arcade.Text(
+                "GAME OVER", center_x, center_y + 50,
+                arcade.color.RED, 34, font_name=HUD_FONT, anchor_x="center",
+            ),
+            self.game_over_score_text,
+            arcade.Text(
+                "[ ENTER ]  RESTART", center_x, center_y - 20,
+                arcade.color.WHITE, 16, font_name=HUD_FONT, anchor_x="center",
+            ),
+            arcade.Text(
+                "[ ESC ]  EXIT", center_x, center_y - 45,
+                HUD_SUBTEXT, 14, font_name=HUD_FONT, anchor_x="center",
+            ),
+        )
+
+        # HUD: fixed labels plus value texts refreshed by _update_hud_values / the FPS tick
+        wave_center = (HUD_SCORE_RIGHT + HUD_WAVE_RIGHT) / 2
+        self.hud_score_text = arcade.Text("", HUD_SCORE_X, HUD_VALUE_Y, HUD_VALUE, 20, font_name=HUD_FONT)
+        self.hud_wave_text = arcade.Text(
+            "", wave_center, HUD_VALUE_Y, HUD_VALUE, 20, font_name=HUD_FONT, anchor_x="center",
+        )
+        self.hud_lives_text = arcade.Text("", 0, HUD_VALUE_Y + 2, HUD_SUBTEXT, 12, font_name=HUD_FONT)
+        self.hud_texts = [
+            arcade.Text("SCORE", HUD_SCORE_X, HUD_LABEL_Y, HUD_LABEL, 12, font_name=HUD_FONT),
+            self.hud_score_text,
+            arcade.Text("WAVE", wave_center, HUD_LABEL_Y, HUD_LABEL, 12, font_name=HUD_FONT, anchor_x="center"),
+            self.hud_wave_text,
+            arcade.Text("LIVES", HUD_LIVES_LEFT, HUD_LABEL_Y, HUD_LABEL, 12, font_name=HUD_FONT),
+            self.hud_lives_text,
+        ]
         if SHOW_FPS:
-            fps_text = "{} FPS".format(self.fps_value)
-            arcade.draw_text(
-                fps_text,
-                SCREEN_W - HUD_PADDING - 8,
-                label_y,
-                HUD_SUBTEXT,
-                12,
-                font_name=HUD_FONT,
-                anchor_x="right"
+            self.hud_fps_text = arcade.Text(
+                "{} FPS".format(self.fps_value), SCREEN_W - HUD_PADDING - 8, HUD_LABEL_Y,
+                HUD_SUBTEXT, 12, font_name=HUD_FONT, anchor_x="right",
             )
+            self.hud_texts.append(self.hud_fps_text)
+        self.hud_dirty = True   # Set wherever score/wave/lives change
+
+        # Wave banner: the backdrop is a retained shape, the label only changes per wave
+        self.banner_overlay = shapes.Rectangle(
+            0, 0, SCREEN_W, SCREEN_H, color=(0, 0, 0, 180), batch=self.banner_batch
+        )
+        self.banner_text = arcade.Text(
+            "WAVE " + str(self.wave), center_x, center_y + 10, arcade.color.WHITE, 44,
+            anchor_x="center",
+        )
+
     # ----------------------------
     # Input handling
     # Player movement uses buffered direction (want_dir) for smoother turns
@@ -1554,33 +1750,44 @@ class PacmanGame(arcade.Window):
                 self.close()
             return
         if symbol == arcade.key.W:
-            self.player.want_dir = "U"
+            self.player.want_dir = DIR_U
         elif symbol == arcade.key.S:
-            self.player.want_dir = "D"
+            self.player.want_dir = DIR_D
         elif symbol == arcade.key.A:
-            self.player.want_dir = "L"
+            self.player.want_dir = DIR_L
         elif symbol == arcade.key.D:
-            self.player.want_dir = "R"
+            self.player.want_dir = DIR_R
 
     # ----------------------------
     # Main update loop
-    # Runs every frame, drives movement, collisions, timers, waves, and AI
+    # on_update runs once per arcade update and only does frame bookkeeping;
+    # on_fixed_update runs at GAME_TICK and drives movement, collisions,
+    # timers, waves, and AI
     # ----------------------------
-    # Main update loop (movement, AI, collisions, timers).
+    # Per-update bookkeeping (stall recovery, FPS counter).
     def on_update(self, delta_time: float):
+        """Frame-rate bookkeeping; gameplay itself runs in on_fixed_update."""
+        # arcade keeps any fixed-tick backlog the cap left behind and would replay
+        # it over the next updates; drop it so a stall costs time, not a fast-forward.
+        while GLOBAL_FIXED_CLOCK.accumulated >= GAME_TICK:
+            GLOBAL_FIXED_CLOCK.tick(GAME_TICK)
+        if self.state != STATE_PLAYING or not SHOW_FPS:
+            return
+        self.fps_accum_time += delta_time
+        self.fps_accum_frames += 1
+        if self.fps_accum_time >= 0.25:
+            self.fps_value = int(self.fps_accum_frames / self.fps_accum_time)
+            self.hud_fps_text.text = "{} FPS".format(self.fps_value)
+            self.fps_accum_time = 0.0
+            self.fps_accum_frames = 0
+
+    # Main update loop (movement, AI, collisions, timers), at a fixed GAME_TICK.
+    def on_fixed_update(self, delta_time: float):
         """Main game loop: movement, collisions, timers, AI, and waves."""
         # If not playing, pause all game logic (menu/game over screens are static)
         if self.state != STATE_PLAYING:
             return
 
-        if SHOW_FPS:
-            self.fps_accum_time += delta_time
-            self.fps_accum_frames += 1
-            if self.fps_accum_time >= 0.25:
-                self.fps_value = int(self.fps_accum_frames / self.fps_accum_time)
-                self.fps_accum_time = 0.0
-                self.fps_accum_frames = 0
-
         self.game_time += delta_time
         if self.ghost_hold_timer > 0.0:
             self.ghost_hold_timer = max(0.0, self.ghost_hold_timer - delta_time)
@@ -1612,11 +1819,11 @@ class PacmanGame(arcade.Window):
             if self.player.want_dir != self.player.dir and self._can_move_dir(self.player, self.player.want_dir):
                 self.player.dir = self.player.want_dir
             if not self._can_move_dir(self.player, self.player.dir):
-                self.player.dir = "S"
+                self.player.dir = DIR_S
 
         # Move the player in the current direction
         moved = self._try_step_sprite(self.player, self.player.dir, MOVE_SPEED)
-        player_moved = moved and self.player.dir != "S"
+        player_moved = moved and self.player.dir != DIR_S
         self.player.update_mouth(delta_time, player_moved)
         if not moved:
             pass
@@ -1634,47 +1841,48 @@ class PacmanGame(arcade.Window):
                 self.trail_skip_next = False
             else:
                 c, r = world_to_grid(self.player.center_x, self.player.center_y)
-                if self.last_trail_cell is None:
-                    if self._add_trail_segment_cell(c, r):
+                last_cell = self.last_trail_cell
+                add_cell = self._add_trail_segment_cell
+                if last_cell is None:
+                    if add_cell(c, r):
                         self._lose_life()
                         return
-                elif self.last_trail_cell != (c, r):
-                    lc, lr = self.last_trail_cell
-                    dc = c - lc
-                    dr = r - lr
-                    if dc != 0 and dr != 0:
-                        # Unexpected diagonal step; just add the target cell.
-                        if self._add_trail_segment_cell(c, r):
+                elif last_cell != (c, r):
+                    lc, lr = last_cell
+                    for nc, nr in trail_sweep(lc, lr, c, r):
+                        if add_cell(nc, nr):
                             self._lose_life()
                             return
-                    elif dc != 0:
-                        step = 1 if dc > 0 else -1
-                        for nc in range(lc + step, c + step, step):
-                            if self._add_trail_segment_cell(nc, lr):
-                                self._lose_life()
-                                return
-                    elif dr != 0:
-                        step = 1 if dr > 0 else -1
-                        for nr in range(lr + step, r + step, step):
-                            if self._add_trail_segment_cell(lc, nr):
-                                self._lose_life()
-                                return
         # Remove expired trail so the maze clears behind the player.
         self._update_trail()
 
-        # Eat dots and power pellets
-        hit_coins = arcade.check_for_collision_with_list(self.player, self.coins)
+        # Eat dots and power pellets. A coin can only overlap the player from the
+        # player's cell or one next to it, so only those cells are probed.
+        pc, pr = world_to_grid(self.player.center_x, self.player.center_y)
+        coin_by_cell = self.coin_by_cell
+        hit_coins = []
+        for dc, dr in COIN_PROBE_OFFSETS:
+            coin = coin_by_cell.get((pc + dc, pr + dr))
+            if coin is not None and arcade.check_for_collision(self.player, coin):
+                hit_coins.append(coin)
         for coin in hit_coins:
             self.player.score += coin.value
+            self.hud_dirty = True
             if coin.value == 50:
                 # Start frightened mode and reverse ghosts immediately
                 self.power_mode_timer = 8.0
                 for g in self.ghosts:
                     if not g.is_dead:
                         g.dir = opp_dir(g.dir)
+                        g.decision_cell = None
                     g.color = arcade.color.BLUE
 
+            coin.delete_shapes()
+            if coin.big:
+                self.power_coins.remove(coin)
+            del coin_by_cell[world_to_grid(coin.center_x, coin.center_y)]
             coin.remove_from_sprite_lists()
+            self.coins_remaining -= 1
 
         power_active = self.power_mode_timer > 0
         if power_active != self.power_mode_active:
@@ -1685,15 +1893,18 @@ class PacmanGame(arcade.Window):
         self.glow_update_timer += delta_time
         if self.glow_update_timer >= 1 / 20:
             self.glow_update_timer = 0.0
-            pulse = 0.5 + 0.5 * math.sin(self.game_time * (2 * math.pi / WALL_GLOW_PULSE_PERIOD))
-            intensity = 1.0 - WALL_GLOW_PULSE_DEPTH / 2 + WALL_GLOW_PULSE_DEPTH * pulse
+            step = int(self.game_time * WALL_GLOW_PULSE_SCALE) & (WALL_GLOW_PULSE_STEPS - 1)
+            intensity = WALL_GLOW_PULSE_LUT[step]
             if self.power_mode_active:
                 intensity *= WALL_GLOW_POWER_BOOST
             self._update_wall_glow(intensity)
 
         # Wave clear: rebuild dots, reset positions, increase wave counter
-        if len(self.coins) == 0:
+        if self.coins_remaining == 0:
             self.wave += 1
+            self.hud_dirty = True
+            self.banner_text.text = "WAVE " + str(self.wave)
+            self.trail_lifetime = self._trail_lifetime()
             self.banner_timer = WAVE_BANNER_SECONDS
             self.power_mode_timer = 0.0
             self.power_mode_active = False
@@ -1718,6 +1929,16 @@ class PacmanGame(arcade.Window):
 
         # Ghost movement and AI
         if not ghosts_frozen:
+            # The player has finished moving this frame, so every ghost targets the same cell
+            self.player_cell = self._player_cell()
+            # Mode, speed and tint are the same for every roaming ghost this frame
+            frightened = self.power_mode_timer > 0
+            speed = frightened_speed if frightened else ghost_speed
+            # Bound once so the per-ghost body avoids repeated attribute lookups
+            step = self._try_step_sprite
+            wrap = self._handle_wrap
+            choose = self._choose_dir_to_target
+            blue = arcade.color.BLUE
             for g in self.ghosts:
                 if g.is_dead:
                     g.respawn_timer -= delta_time
@@ -1725,7 +1946,8 @@ class PacmanGame(arcade.Window):
                         g.is_dead = False
                         g.center_x, g.center_y = self.ghost_house_pos
                         self._snap_to_tile_center(g)
-                        g.dir = "U"
+                        g.dir = DIR_U
+                        g.decision_cell = None
                         g.exit_timer = 1.2
                         g.color = g.base_color
                     continue
@@ -1733,31 +1955,39 @@ class PacmanGame(arcade.Window):
                 if g.exit_timer > 0:
                     g.exit_timer -= delta_time
                     g.color = g.base_color
-                    self._try_step_sprite(g, "U", ghost_speed)
-                    self._handle_wrap(g)
+                    step(g, DIR_U, ghost_speed)
+                    wrap(g)
                     continue
 
-                frightened = self.power_mode_timer > 0
-                speed = frightened_speed if frightened else ghost_speed
-
-                # Choose direction only at tile centers, based on target tile
-                if at_tile_center(g.center_x, g.center_y):
-                    target = self._ghost_target_cell(g)
-                    g.dir = self._choose_dir_to_target(g, target, frightened)
+                # Choose direction only at tile centers, based on target tile.
+                # Speeds need not divide TILE, so instead of a center window the
+                # ghost decides on the step that reaches or crosses its tile's
+                # center: it snaps there, picks, and spends the rest of the step
+                # in the new direction. Once per tile; between centers g.dir is reused.
+                step_len = speed
+                gx, gy = g.position
+                cell = world_to_grid(gx, gy)
+                if cell != g.decision_cell:
+                    cx, cy = GRID_X[cell[0] + 1], GRID_Y[cell[1] + 1]
+                    dx, dy = DIRS[g.dir]
+                    ahead = (cx - gx) * dx + (cy - gy) * dy   # Distance to center along g.dir
+                    if 0 <= ahead < speed:
+                        g.decision_cell = cell
+                        g.position = (cx, cy)
+                        g.dir = choose(g, frightened)
+                        step_len = speed - ahead
 
                 # Move ghost, and if blocked, re-pick immediately to avoid freezing
-                moved_ghost = self._try_step_sprite(g, g.dir, speed)
-                if not moved_ghost:
-                    target = self._ghost_target_cell(g)
-                    g.dir = self._choose_dir_to_target(g, target, frightened)
-                    self._try_step_sprite(g, g.dir, speed)
+                if not step(g, g.dir, step_len):
+                    g.dir = choose(g, frightened)
+                    step(g, g.dir, step_len)
 
                 # Tunnel wrap for ghosts
-                self._handle_wrap(g)
+                wrap(g)
 
                 # Visual color state for frightened mode
                 if frightened:
-                    g.color = arcade.color.BLUE
+                    g.color = blue
                 else:
                     g.color = g.base_color
 
@@ -1769,6 +1999,7 @@ class PacmanGame(arcade.Window):
                 if (not g.is_dead) and (g.exit_timer <= 0):
                     if self.power_mode_timer > 0:
                         self.player.score += 200
+                        self.hud_dirty = True
                         g.is_dead = True
                         g.respawn_timer = 5.0
                         g.center_x, g.center_y = -100, -100
@@ -1789,25 +2020,19 @@ class PacmanGame(arcade.Window):
             return
 
         self.clear()
-        self._draw_floor()
-        self.wall_glow_shapes.draw()
-        self.wall_base_shapes.draw()
-        self.wall_edge_shapes.draw()
+        self._draw_maze()
         self._draw_trail()
-        for coin in self.coins:
-            self._draw_coin(coin)
+        self._draw_coins()
         for g in self.ghosts:
-            self._draw_ghost(g)
-
-        self._draw_pacman(self.player)
+            g.update_shapes()
+        self.player.update_shapes()
+        self.actor_batch.draw()
 
         self._draw_hud()
 
-        overlay_rect = arcade.XYWH(SCREEN_W / 2, SCREEN_H / 2, SCREEN_W, SCREEN_H)
-
         if self.state == STATE_PLAYING and self.banner_timer > 0:
-            arcade.draw_rect_filled(overlay_rect, (0, 0, 0, 180))
-            arcade.draw_text("WAVE " + str(self.wave), SCREEN_W / 2, SCREEN_H / 2 + 10, arcade.color.WHITE, 44, anchor_x="center")
+            self.banner_batch.draw()
+            self.banner_text.draw()
 
 # ----------------------------
 # Entry point
@@ -0,0 +1,65 @@
+# Regression check: leaving a tunnel mouth and steering up/down off the map
+# must keep the game running (trail stamps and cell centers used to index
+# past the map tables there).
+import importlib.util
+import os
+from pathlib import Path
+
+import pytest
+
+os.environ.setdefault("ARCADE_HEADLESS", "1")
+arcade = pytest.importorskip("arcade")
+
+GAME_PATH = Path(__file__).resolve().parent.parent / "PacSnake - No Return_(OverKill).py"
+TUNNEL_ROW = 10
+TICKS = 400
+
+
+# Load the game module from its file (the name is not importable as-is).
+def _load_game():
+    spec = importlib.util.spec_from_file_location("pacsnake", GAME_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+game = _load_game()
+
+
+# Head out of one tunnel mouth, turn vertically at the edge, and keep going.
+@pytest.mark.parametrize("side", ["left", "right"])
+@pytest.mark.parametrize("vertical", [arcade.key.W, arcade.key.S])
+def test_player_can_leave_tunnel_mouth_vertically(side, vertical):
+    assert game.IS_TUNNEL_ROW[TUNNEL_ROW + 1]
+    g = game.PacmanGame()
+    try:
+        g._start_game()
+        g.ghost_hold_timer = float("inf")   # Keep ghosts home so only the trail matters
+        player = g.player
+        if side == "left":
+            player.position = (game.CELL_CX[0], game.CELL_CY[TUNNEL_ROW])
+            g.on_key_press(arcade.key.A, 0)
+            edge_x = game.WRAP_LEFT_X
+        else:
+            player.position = (game.CELL_CX[-1], game.CELL_CY[TUNNEL_ROW])
+            g.on_key_press(arcade.key.D, 0)
+            edge_x = game.WRAP_RIGHT_X
+        g._clear_trail()
+
+        turned = False
+        rows = set()
+        for _ in range(TICKS):
+            if not turned and player.center_x == edge_x:
+                g.on_key_press(vertical, 0)
+                turned = True
+            g.on_update(game.GAME_TICK)
+            g.on_fixed_update(game.GAME_TICK)
+            rows.add(game.world_to_grid(*player.position)[1])
+
+        assert turned
+        assert g.state == game.STATE_PLAYING
+        assert player.center_x == edge_x
+        # The player must have travelled well past the padded map tables
+        assert min(rows) < -2 or max(rows) > game.ROWS + 1
+    finally:
+        g.close()